@@ -1,6 +1,12 @@
 from __future__ import annotations
+import argparse
+import heapq
+import random
+import timeit
+import tracemalloc
+from array import array
 from dataclasses import dataclass
-from typing import Optional, Iterable, Callable, Any
+from typing import Optional, Iterable, Iterator, Callable, Any
 
 
 # ---------- Базові структури ----------
@@ -14,24 +20,54 @@ class Node:
 class SinglyLinkedList:
     def __init__(self, iterable: Optional[Iterable[Any]] = None):
         self.head: Optional[Node] = None
+        self.tail: Optional[Node] = None  # останній вузол — для append за O(1)
+        self._size = 0
         if iterable:
-            for x in iterable:
-                self.append(x)
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any]) -> "SinglyLinkedList":
+        """Будує список за один прохід, зв'язуючи вузли без повторних обходів."""
+        out = cls()
+        out.extend(iterable)
+        return out
+
+    def __len__(self) -> int:
+        return self._size
 
     # Утиліти
     def append(self, value: Any) -> None:
         new_node = Node(value)
-        if self.head is None:
+        if self.tail is None:
             self.head = new_node
-            return
-        cur = self.head
-        while cur.next:
-            cur = cur.next
-        cur.next = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self._size += 1
 
     def extend(self, it: Iterable[Any]) -> None:
+        # фіктивний вузол дозволяє не перевіряти порожній список у циклі
+        dummy = Node(None)
+        tail, count = dummy, 0
         for x in it:
-            self.append(x)
+            node = Node(x)
+            tail.next = node
+            tail = node
+            count += 1
+        if count == 0:
+            return
+        if self.tail is None:
+            self.head = dummy.next
+        else:
+            self.tail.next = dummy.next
+        self.tail = tail
+        self._size += count
+
+    def __iter__(self):
+        cur = self.head
+        while cur:
+            yield cur.value
+            cur = cur.next
 
     def to_list(self) -> list[Any]:
         res, cur = [], self.head
@@ -42,10 +78,19 @@ class SinglyLinkedList:
 
     def clear(self) -> None:
         self.head = None
+        self.tail = None
+        self._size = 0
+
+    def _set_chain(self, head: Optional[Node], size: int) -> None:
+        """Встановлює новий ланцюжок вузлів і знаходить його хвіст."""
+        self.head = head
+        self.tail = _tail_of(head)
+        self._size = size
 
     # 1) Реверсування
     def reverse(self) -> None:
         prev, cur = None, self.head
+        self.tail = cur  # колишня голова стає хвостом
         while cur:
             nx = cur.next
             cur.next = prev
@@ -55,22 +100,41 @@ class SinglyLinkedList:
 
     # 2a) Сортування злиттям
     def sort_merge(self, key: Optional[Callable[[Any], Any]] = None) -> None:
-        self.head = _merge_sort(self.head, key)
+        self.head, self.tail = _natural_merge_sort(self.head, key)
 
     # 2b) Сортування вставками
     def sort_insertion(self, key: Optional[Callable[[Any], Any]] = None) -> None:
-        self.head = _insertion_sort(self.head, key)
+        self._set_chain(_insertion_sort(self.head, key), self._size)
 
     # 3) Злиття двох відсортованих
     def merge_sorted_with(self, other: "SinglyLinkedList",
                           key: Optional[Callable[[Any], Any]] = None) -> "SinglyLinkedList":
+        """
+        Зливає два відсортовані списки, перев'язуючи їхні вузли.
+        Вузли переходять у результат, тому self та other стають порожніми.
+        """
         out = SinglyLinkedList()
-        out.head = _merge_two_sorted_lists(self.head, other.head, key)
+        if other is self:
+            # злиття списку з самим собою — той самий ланцюжок, як у PooledLinkedList
+            out.head, out.tail, out._size = self.head, self.tail, self._size
+        else:
+            out._set_chain(_merge_two_sorted_lists(self.head, other.head, key),
+                           len(self) + len(other))
+            other.clear()
+        self.clear()
         return out
 
 
 # ---------- Допоміжні функції для сортувань/злиття ----------
 
+def _tail_of(head: Optional[Node]) -> Optional[Node]:
+    if head is None:
+        return None
+    while head.next:
+        head = head.next
+    return head
+
+
 def _split_middle(head: Optional[Node]) -> tuple[Optional[Node], Optional[Node]]:
     if head is None or head.next is None:
         return head, None
@@ -110,6 +174,92 @@ def _merge_sort(head: Optional[Node],
     return _merge_by_key(left, right, key)
 
 
+def _split_runs(head: Optional[Node]) -> list[tuple[Node, Node]]:
+    """
+    Ділить ланцюжок на природні серії (голова, хвіст): неспадні беруться як є,
+    строго спадні перевертаються на місці (строгість зберігає стабільність).
+    """
+    runs = []
+    cur = head
+    while cur:
+        nxt = cur.next
+        if nxt is not None and nxt.value < cur.value:
+            run_tail, prev = cur, None
+            while True:
+                nxt = cur.next
+                cur.next = prev
+                prev = cur
+                if nxt is None or not (nxt.value < cur.value):
+                    break
+                cur = nxt
+            runs.append((prev, run_tail))
+        else:
+            run_head = cur
+            while nxt is not None and not (nxt.value < cur.value):
+                cur = nxt
+                nxt = cur.next
+            cur.next = None
+            runs.append((run_head, cur))
+        cur = nxt
+    return runs
+
+
+def _merge_runs(a: Node, a_tail: Node, b: Node, b_tail: Node) -> tuple[Node, Node]:
+    """Стабільне злиття двох серій; хвіст відомий заздалегідь, тож без дообходу."""
+    dummy = Node(None)
+    tail = dummy
+    while a and b:
+        if a.value <= b.value:
+            tail.next = a
+            tail = a
+            a = a.next
+        else:
+            tail.next = b
+            tail = b
+            b = b.next
+    if a:
+        tail.next = a
+        return dummy.next, a_tail
+    tail.next = b
+    return dummy.next, b_tail
+
+
+def _natural_merge_sort(head: Optional[Node],
+                        key: Optional[Callable[[Any], Any]] = None
+                        ) -> tuple[Optional[Node], Optional[Node]]:
+    """
+    Ітеративне сортування злиттям знизу вгору за природними серіями.
+    Ключ обчислюється один раз на елемент (decorate/undecorate): на час
+    сортування node.value замінюється ключем, а потім відновлюється.
+    Відсортований або обернений вхід — одна серія, тобто O(n).
+    Повертає (голова, хвіст).
+    """
+    if head is None or head.next is None:
+        return head, head
+    nodes: list[Node] = []
+    originals: list[Any] = []
+    try:
+        if key is not None:
+            cur = head
+            while cur:
+                k = key(cur.value)
+                nodes.append(cur)
+                originals.append(cur.value)
+                cur.value = k
+                cur = cur.next
+        runs = _split_runs(head)
+        while len(runs) > 1:
+            merged = [_merge_runs(*runs[i], *runs[i + 1])
+                      for i in range(0, len(runs) - 1, 2)]
+            if len(runs) % 2:
+                merged.append(runs[-1])
+            runs = merged
+    finally:
+        for node, v in zip(nodes, originals):
+            node.value = v
+    return runs[0]
+
+
 def _insertion_sort(head: Optional[Node],
                     key: Optional[Callable[[Any], Any]] = None) -> Optional[Node]:
     key_fn = key if key else (lambda x: x)
@@ -132,6 +282,441 @@ def _merge_two_sorted_lists(a: Optional[Node], b: Optional[Node],
     return _merge_by_key(a, b, key)
 
 
+# ---------- K-шляхове злиття ----------
+
+def iter_merge_many(sources: Iterable[Iterable[Any]],
+                    key: Optional[Callable[[Any], Any]] = None) -> Iterator[Any]:
+    """
+    Ліниве злиття k відсортованих джерел (списки, ітератори, генератори)
+    за O(n log k). Нічого не матеріалізує; при рівних ключах першим іде
+    елемент із джерела з меншим номером (стабільність).
+    """
+    return heapq.merge(*sources, key=key)
+
+
+def merge_many(sources: Iterable[Any],
+               key: Optional[Callable[[Any], Any]] = None) -> SinglyLinkedList:
+    """
+    Зливає k відсортованих списків у новий SinglyLinkedList за O(n log k),
+    перев'язуючи наявні вузли. Вхідні SinglyLinkedList стають порожніми;
+    інші ітеровані джерела спершу перетворюються на ланцюжок вузлів.
+    Ключ обчислюється один раз на елемент, злиття стабільне.
+    """
+    key_fn = key if key else (lambda x: x)
+    out = SinglyLinkedList()
+    heap: list[tuple[Any, int, Node]] = []
+    total = 0
+    for idx, src in enumerate(sources):
+        if not isinstance(src, SinglyLinkedList):
+            src = SinglyLinkedList.from_iterable(src)
+        head, size = src.head, len(src)
+        src.clear()
+        if head is not None:
+            heap.append((key_fn(head.value), idx, head))
+            total += size
+    heapq.heapify(heap)
+
+    dummy = Node(None)
+    tail = dummy
+    while len(heap) > 1:
+        _, idx, node = heap[0]
+        tail.next = node
+        tail = node
+        nxt = node.next
+        if nxt is None:
+            heapq.heappop(heap)
+        else:
+            heapq.heapreplace(heap, (key_fn(nxt.value), idx, nxt))
+    if heap:
+        # останнє джерело дописуємо цілим хвостом
+        tail.next = heap[0][2]
+    out._set_chain(dummy.next, total)
+    return out
+
+
+# ---------- Пул вузлів: масиви замість об'єктів Node ----------
+
+NIL = -1  # "порожнє" посилання у пулі
+
+
+class PooledLinkedList:
+    """
+    Однозв'язний список, де вузол — це індекс у паралельних стовпцях:
+      - _values[i] — значення (list або array з typecode, напр. 'q' для int64);
+      - _next[i]   — індекс наступного вузла (array('q'), NIL = кінець).
+    Звільнені слоти утворюють free list і використовуються повторно.
+    API збігається з SinglyLinkedList.
+    """
+
+    def __init__(self, iterable: Optional[Iterable[Any]] = None,
+                 typecode: Optional[str] = None):
+        self._typecode = typecode
+        self._values = array(typecode) if typecode else []
+        self._next = array("q")
+        self.head = NIL
+        self.tail = NIL
+        self._size = 0
+        self._free = NIL
+        if iterable:
+            self.extend(iterable)
+
+    @classmethod
+    def from_iterable(cls, iterable: Iterable[Any],
+                      typecode: Optional[str] = None) -> "PooledLinkedList":
+        out = cls(typecode=typecode)
+        out.extend(iterable)
+        return out
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self):
+        vals, nxt, cur = self._values, self._next, self.head
+        while cur != NIL:
+            yield vals[cur]
+            cur = nxt[cur]
+
+    # Утиліти
+    def _alloc(self, value: Any) -> int:
+        i = self._free
+        if i == NIL:
+            self._values.append(value)
+            self._next.append(NIL)
+            return len(self._next) - 1
+        self._free = self._next[i]
+        self._values[i] = value
+        self._next[i] = NIL
+        return i
+
+    def append(self, value: Any) -> None:
+        i = self._alloc(value)
+        if self.tail == NIL:
+            self.head = i
+        else:
+            self._next[self.tail] = i
+        self.tail = i
+        self._size += 1
+
+    def extend(self, it: Iterable[Any]) -> None:
+        if self._free != NIL:
+            for x in it:
+                self.append(x)
+            return
+        # вільних слотів немає — дописуємо стовпці цілими блоками
+        start = len(self._values)
+        try:
+            self._values.extend(it)
+        except BaseException:
+            # ітератор упав посередині — відкочуємо, щоб стовпці не розійшлися
+            del self._values[start:]
+            raise
+        end = len(self._values)
+        if end == start:
+            return
+        self._next.extend(range(start + 1, end + 1))
+        self._next[end - 1] = NIL
+        if self.tail == NIL:
+            self.head = start
+        else:
+            self._next[self.tail] = start
+        self.tail = end - 1
+        self._size += end - start
+
+    def popleft(self) -> Any:
+        """Видаляє перший елемент; його слот повертається у free list."""
+        i = self.head
+        if i == NIL:
+            raise IndexError("popleft from empty list")
+        value = self._values[i]
+        self.head = self._next[i]
+        if self.head == NIL:
+            self.tail = NIL
+        if self._typecode is None:
+            self._values[i] = None  # не тримаємо посилання на об'єкт
+        self._next[i] = self._free
+        self._free = i
+        self._size -= 1
+        return value
+
+    def to_list(self) -> list[Any]:
+        return list(self)
+
+    def clear(self) -> None:
+        self._values = array(self._typecode) if self._typecode else []
+        self._next = array("q")
+        self.head = self.tail = self._free = NIL
+        self._size = 0
+
+    # 1) Реверсування
+    def reverse(self) -> None:
+        nxt = self._next
+        prev, cur = NIL, self.head
+        self.tail = cur
+        while cur != NIL:
+            nx = nxt[cur]
+            nxt[cur] = prev
+            prev = cur
+            cur = nx
+        self.head = prev
+
+    # 2a) Сортування злиттям
+    def sort_merge(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        self.head, self.tail = _pool_merge_sort(self._values, self._next, self.head, key)
+
+    # 2b) Сортування вставками
+    def sort_insertion(self, key: Optional[Callable[[Any], Any]] = None) -> None:
+        key_fn = key if key else (lambda x: x)
+        vals, nxt = self._values, self._next
+        head, tail = NIL, NIL
+        cur = self.head
+        while cur != NIL:
+            following = nxt[cur]
+            k = key_fn(vals[cur])
+            prev, it = NIL, head
+            while it != NIL and key_fn(vals[it]) <= k:
+                prev, it = it, nxt[it]
+            nxt[cur] = it
+            if prev == NIL:
+                head = cur
+            else:
+                nxt[prev] = cur
+            if it == NIL:
+                tail = cur
+            cur = following
+        self.head, self.tail = head, tail
+
+    # 3) Злиття двох відсортованих
+    def merge_sorted_with(self, other: "PooledLinkedList | SinglyLinkedList",
+                          key: Optional[Callable[[Any], Any]] = None) -> "PooledLinkedList":
+        """
+        Стабільне злиття. Результат забирає пул self (без копіювання), значення
+        other дописуються в той самий пул, далі ланцюжки перев'язуються.
+        Як і в SinglyLinkedList, обидва вхідні списки стають порожніми.
+        """
+        out = PooledLinkedList(typecode=self._typecode)
+        out._values, out._next, out._free = self._values, self._next, self._free
+        out.head, out.tail, out._size = self.head, self.tail, self._size
+        a_head = out.head
+        if other is not self:
+            b = PooledLinkedList.from_iterable(other, typecode=self._typecode)
+            offset = len(out._values)
+            out._values.extend(b._values)
+            out._next.extend(j + offset if j != NIL else NIL for j in b._next)
+            b_head = b.head + offset if b.head != NIL else NIL
+            b_tail = b.tail + offset if b.tail != NIL else NIL
+            keys = _pool_keys(out._values, out._next, (a_head, b_head), key)
+            out.head, out.tail = _pool_merge(keys, out._next, a_head, out.tail, b_head, b_tail)
+            out._size += len(b)
+            other.clear()
+        self._values = array(self._typecode) if self._typecode else []
+        self._next = array("q")
+        self.head = self.tail = self._free = NIL
+        self._size = 0
+        return out
+
+
+def _pool_keys(vals, nxt, heads: Iterable[int],
+               key: Optional[Callable[[Any], Any]]):
+    """Стовпець ключів для живих вузлів: key обчислюється рівно раз на вузол."""
+    if key is None:
+        return vals
+    keys: list[Any] = [None] * len(vals)
+    for cur in heads:
+        while cur != NIL:
+            keys[cur] = key(vals[cur])
+            cur = nxt[cur]
+    return keys
+
+
+def _pool_merge(keys, nxt, a: int, a_tail: int, b: int, b_tail: int) -> tuple[int, int]:
+    """Стабільно зливає два ланцюжки індексів, повертає (голова, хвіст)."""
+    if a == NIL:
+        return b, b_tail
+    if b == NIL:
+        return a, a_tail
+    if keys[a] <= keys[b]:
+        head = tail = a
+        a = nxt[a]
+    else:
+        head = tail = b
+        b = nxt[b]
+    while a != NIL and b != NIL:
+        if keys[a] <= keys[b]:
+            nxt[tail] = a
+            tail = a
+            a = nxt[a]
+        else:
+            nxt[tail] = b
+            tail = b
+            b = nxt[b]
+    if a != NIL:
+        nxt[tail] = a
+        return head, a_tail
+    nxt[tail] = b
+    return head, b_tail
+
+
+def _pool_split_runs(keys, nxt, head: int) -> list[tuple[int, int]]:
+    """Аналог _split_runs для індексів пулу."""
+    runs = []
+    cur = head
+    while cur != NIL:
+        following = nxt[cur]
+        if following != NIL and keys[following] < keys[cur]:
+            run_tail, prev = cur, NIL
+            while True:
+                following = nxt[cur]
+                nxt[cur] = prev
+                prev = cur
+                if following == NIL or not (keys[following] < keys[cur]):
+                    break
+                cur = following
+            runs.append((prev, run_tail))
+        else:
+            run_head = cur
+            while following != NIL and not (keys[following] < keys[cur]):
+                cur = following
+                following = nxt[cur]
+            nxt[cur] = NIL
+            runs.append((run_head, cur))
+        cur = following
+    return runs
+
+
+def _pool_merge_sort(vals, nxt, head: int,
+                     key: Optional[Callable[[Any], Any]] = None) -> tuple[int, int]:
+    """Злиття природних серій знизу вгору без рекурсії, ключі — з кешу."""
+    if head == NIL or nxt[head] == NIL:
+        return head, head
+    keys = _pool_keys(vals, nxt, (head,), key)
+    runs = _pool_split_runs(keys, nxt, head)
+    while len(runs) > 1:
+        merged = [_pool_merge(keys, nxt, *runs[i], *runs[i + 1])
+                  for i in range(0, len(runs) - 1, 2)]
+        if len(runs) % 2:
+            merged.append(runs[-1])
+        runs = merged
+    return runs[0]
+
+
+# ---------- Бенчмарк ----------
+
+def _build_by_walking(values: list[Any]) -> Optional[Node]:
+    """Стара побудова: кожен append іде від голови до кінця — O(n²)."""
+    head = None
+    for v in values:
+        node = Node(v)
+        if head is None:
+            head = node
+            continue
+        cur = head
+        while cur.next:
+            cur = cur.next
+        cur.next = node
+    return head
+
+
+def _bench(fn, repeat: int = 3) -> float:
+    return min(timeit.Timer(fn).repeat(repeat=repeat, number=1))
+
+
+def benchmark_construction(sizes: Iterable[int] = (1_000, 2_000, 4_000, 50_000, 100_000, 200_000)) -> None:
+    """Порівнює час побудови списку: обхід до кінця vs хвостовий вказівник."""
+    print(f"{'n':>8} | {'walk (O(n²))':>13} | {'append':>9} | {'from_iterable':>13} | {'мкс/елемент':>11}")
+    for n in sizes:
+        data = list(range(n))
+        walk = _bench(lambda: _build_by_walking(data), repeat=1) if n <= 4_000 else None
+
+        def by_append():
+            sll = SinglyLinkedList()
+            for v in data:
+                sll.append(v)
+
+        app = _bench(by_append)
+        bulk = _bench(lambda: SinglyLinkedList.from_iterable(data))
+        walk_s = f"{walk:.4f}s" if walk is not None else "-"
+        print(f"{n:>8} | {walk_s:>13} | {app:>8.4f}s | {bulk:>12.4f}s | {bulk / n * 1e6:>11.3f}")
+
+
+def _traced_bytes(build) -> tuple[int, Any]:
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, obj
+
+
+def benchmark_memory(n: int = 200_000) -> None:
+    """Байти на елемент і швидкість обходу: об'єкти Node vs пул з масивами."""
+    data = list(range(n))
+    variants = [
+        ("Node (dataclass)", lambda: SinglyLinkedList.from_iterable(data)),
+        ("Pool (list values)", lambda: PooledLinkedList.from_iterable(data)),
+        ("Pool (array 'q')", lambda: PooledLinkedList.from_iterable(data, typecode="q")),
+    ]
+    print(f"n = {n}")
+    print(f"{'структура':<20} | {'байт/елемент':>12} | {'обхід':>9} | {'sort_merge':>10}")
+    for name, build in variants:
+        used, sll = _traced_bytes(build)
+        walk = _bench(lambda: sum(sll))
+        shuffled = build()
+        shuffled.reverse()
+        srt = _bench(shuffled.sort_merge, repeat=1)
+        print(f"{name:<20} | {used / n:>12.1f} | {walk:>8.4f}s | {srt:>9.4f}s")
+
+
+def _sort_dataset(n: int, kind: str, seed: int = 12345) -> list[int]:
+    rng = random.Random(seed)
+    if kind == "reversed":
+        return list(range(n, 0, -1))
+    if kind == "nearly":
+        x = list(range(n))
+        for _ in range(max(1, n // 100)):
+            i, j = rng.randrange(n), rng.randrange(n)
+            x[i], x[j] = x[j], x[i]
+        return x
+    return [rng.randint(0, 10**9) for _ in range(n)]
+
+
+def benchmark_sort(n: int = 100_000) -> None:
+    """Рекурсивне сортування (_merge_sort) vs злиття природних серій з кешем ключів."""
+    key = lambda v: -v  # ключ, щоб було видно ціну повторних викликів
+    print(f"n = {n}")
+    print(f"{'dataset':<9} | {'recursive':>10} | {'natural':>9} | {'natural+key':>11} | {'pool+key':>9}")
+    for kind in ("random", "nearly", "reversed"):
+        data = _sort_dataset(n, kind)
+
+        def recursive():
+            sll = SinglyLinkedList(data)
+            sll.head = _merge_sort(sll.head, key)
+
+        rec = _bench(recursive, repeat=1)
+        nat = _bench(lambda: SinglyLinkedList(data).sort_merge(), repeat=1)
+        nat_key = _bench(lambda: SinglyLinkedList(data).sort_merge(key=key), repeat=1)
+        pool_key = _bench(lambda: PooledLinkedList(data).sort_merge(key=key), repeat=1)
+        print(f"{kind:<9} | {rec:>9.4f}s | {nat:>8.4f}s | {nat_key:>10.4f}s | {pool_key:>8.4f}s")
+
+
+def benchmark_kway(n: int = 200_000, shards: Iterable[int] = (2, 8, 32, 128)) -> None:
+    """Попарне merge_sorted_with по черзі vs merge_many vs лінивий iter_merge_many."""
+    rng = random.Random(12345)
+    data = [rng.randint(0, 10**9) for _ in range(n)]
+    print(f"n = {n}")
+    print(f"{'k':>5} | {'pairwise':>9} | {'merge_many':>10} | {'iter_merge_many':>15}")
+    for k in shards:
+        parts = [sorted(data[i::k]) for i in range(k)]
+
+        def pairwise():
+            acc = SinglyLinkedList()
+            for p in parts:
+                acc = acc.merge_sorted_with(SinglyLinkedList(p))
+
+        pw = _bench(pairwise, repeat=1)
+        mm = _bench(lambda: merge_many(SinglyLinkedList(p) for p in parts), repeat=1)
+        it = _bench(lambda: sum(iter_merge_many(iter(p) for p in parts)), repeat=1)
+        print(f"{k:>5} | {pw:>8.4f}s | {mm:>9.4f}s | {it:>14.4f}s")
+
+
 # ---------- Інтерактивне меню ----------
 
 def parse_values(line: str) -> list[int]:
@@ -203,9 +788,9 @@ def menu():
                 print(e)
                 continue
             other = SinglyLinkedList(vals)
-            merged = sll.merge_sorted_with(other)  # стабільне злиття
+            sll = sll.merge_sorted_with(other)  # стабільне злиття, вузли переходять у результат
             print("Результат злиття:")
-            print_list("Merged", merged)
+            print_list("Merged", sll)
 
         elif choice == "6":
             print("Введіть елементи для додавання (через пробіл):")
@@ -238,4 +823,16 @@ def menu():
 
 
 if __name__ == "__main__":
-    menu()
+    ap = argparse.ArgumentParser(description="Робота з однозв'язним списком.")
+    ap.add_argument("--bench", choices=["build", "memory", "sort", "kway"], help="Запустити бенчмарк замість меню")
+    args = ap.parse_args()
+    if args.bench == "build":
+        benchmark_construction()
+    elif args.bench == "memory":
+        benchmark_memory()
+    elif args.bench == "sort":
+        benchmark_sort()
+    elif args.bench == "kway":
+        benchmark_kway()
+    else:
+        menu()
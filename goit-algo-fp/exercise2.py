@@ -1,10 +1,17 @@
 # pythagoras_tree.py
-# Фрактал "дерево Піфагора" (лінійна версія) з рекурсією.
+# Фрактал "дерево Піфагора" (лінійна версія).
 # Користувач задає глибину, базову довжину та кут.
-# Без зовнішніх бібліотек — використовуємо стандартний turtle.
+# Геометрія рахується без малювання: усі гілки одного рівня — NumPy-масиви.
+# Далі дерево можна експортувати в SVG/PNG або показати через стандартний turtle.
 
+import argparse
 import math
-import turtle
+import time
+
+import numpy as np
+
+LEAF_COLOR = (30, 170, 60)
+
 
 # --- параметри від користувача ---
 def ask_int(prompt, default):
@@ -21,21 +28,6 @@ def ask_float(prompt, default):
     except Exception:
         return default
 
-DEPTH = ask_int("Вкажіть рівень рекурсії (0..14)", 10)
-BASE = ask_int("Довжина базової гілки (пікселі)", 120)
-ANGLE = ask_float("Кут відхилення гілок у градусах", 45)
-
-# --- налаштування полотна ---
-turtle.colormode(255)
-turtle.title("Фрактал: дерево Піфагора")
-turtle.setup(width=1000, height=800)
-turtle.bgcolor("white")
-
-pen = turtle.Turtle(visible=False)
-pen.speed(0)
-pen.hideturtle()
-pen.pensize(2)
-
 # плавний перехід кольору від темного до світлого з глибиною
 def color_for(depth, max_depth):
     # від коричневого до зеленого
@@ -45,38 +37,172 @@ def color_for(depth, max_depth):
     b = int(40  * (1 - t) + 60)   # 100..60
     return (r, g, b)
 
-# Рекурсивний малюнок дерева (лінійна версія — гілки як відрізки)
-def draw_tree(length, depth):
-    if depth == 0 or length < 2:
-        # листок
-        pen.pencolor(30, 170, 60)
-        pen.forward(length)
-        pen.backward(length)
-        return
-
-    pen.pencolor(color_for(depth, DEPTH))
-    # Стовбур
-    pen.forward(length)
-
-    # ліва гілка
-    pen.left(ANGLE)
-    draw_tree(length * math.cos(math.radians(ANGLE)), depth - 1)
-    pen.right(ANGLE)
-
-    # права гілка
-    pen.right(ANGLE)
-    draw_tree(length * math.cos(math.radians(ANGLE)), depth - 1)
-    pen.left(ANGLE)
-
-    pen.backward(length)
 
-# Початкове позиціювання — “знизу по центру”, ріст вгору
-pen.up()
-pen.setheading(90)           # вгору
-pen.goto(0, -350)            # низ екрана
-pen.down()
-
-draw_tree(BASE, DEPTH)
-
-turtle.done()
+# --- геометрія без рекурсії ---
+def tree_segments(depth, base, angle, origin=(0.0, -350.0)):
+    """
+    Будує всі гілки дерева рівень за рівнем. На рівні k (залишок глибини depth - k)
+    усі 2**k гілки мають однакову довжину base * cos(angle)**k, тож кожен рівень —
+    одна векторна операція. Правила ті самі, що й у рекурсивній turtle-версії:
+    листок — коли залишок глибини 0 або довжина < 2.
+    Повертає словник масивів довжини N (кількість гілок):
+      x0, y0, x1, y1 — кінці відрізків; depth — залишок глибини;
+      colors — (N, 3) uint8 з color_for (листки — LEAF_COLOR).
+    """
+    if depth < 0:
+        raise ValueError(f"глибина має бути >= 0, отримано {depth}")
+    shrink = math.cos(math.radians(angle))
+    turn = math.radians(angle)
+    xs = np.array([float(origin[0])])
+    ys = np.array([float(origin[1])])
+    heading = np.array([math.pi / 2])   # вгору
+    length = float(base)
+    parts = {"x0": [], "y0": [], "x1": [], "y1": [], "depth": [], "colors": []}
+
+    for k in range(depth + 1):
+        left = depth - k
+        leaf = left == 0 or length < 2
+        x1 = xs + length * np.cos(heading)
+        y1 = ys + length * np.sin(heading)
+        n = len(xs)
+        parts["x0"].append(xs)
+        parts["y0"].append(ys)
+        parts["x1"].append(x1)
+        parts["y1"].append(y1)
+        parts["depth"].append(np.full(n, left, dtype=np.int16))
+        color = LEAF_COLOR if leaf else color_for(left, depth)
+        parts["colors"].append(np.tile(np.array(color, dtype=np.uint8), (n, 1)))
+        if leaf:
+            break
+        # кожна гілка породжує ліву (+angle) і праву (-angle) з кінця батька
+        xs = np.concatenate((x1, x1))
+        ys = np.concatenate((y1, y1))
+        heading = np.concatenate((heading + turn, heading - turn))
+        length *= shrink
+
+    return {key: np.concatenate(chunks) for key, chunks in parts.items()}
+
+
+# --- експорт ---
+def _levels(seg):
+    """Межі блоків однакового кольору (гілки одного рівня йдуть поспіль)."""
+    d = seg["depth"]
+    cuts = np.flatnonzero(np.diff(d)) + 1
+    starts = np.concatenate(([0], cuts))
+    ends = np.concatenate((cuts, [len(d)]))
+    return zip(starts, ends)
+
+
+def export_svg(seg, path, stroke_width=2, margin=10):
+    """Записує відрізки в SVG: один <path> на рівень, y перевернуто для екранних координат."""
+    xs = np.concatenate((seg["x0"], seg["x1"]))
+    ys = np.concatenate((seg["y0"], seg["y1"]))
+    min_x, max_x = xs.min() - margin, xs.max() + margin
+    min_y, max_y = -ys.max() - margin, -ys.min() + margin
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" '
+                f'viewBox="{min_x:.1f} {min_y:.1f} {max_x - min_x:.1f} {max_y - min_y:.1f}">\n'
+                f'<rect x="{min_x:.1f}" y="{min_y:.1f}" width="100%" height="100%" fill="white"/>\n')
+        for a, b in _levels(seg):
+            r, g, bl = seg["colors"][a]
+            f.write(f'<path fill="none" stroke="rgb({r},{g},{bl})" '
+                    f'stroke-width="{stroke_width}" stroke-linecap="round" d="')
+            block = np.column_stack((seg["x0"][a:b], -seg["y0"][a:b],
+                                     seg["x1"][a:b], -seg["y1"][a:b]))
+            np.savetxt(f, block, fmt="M%.1f %.1fL%.1f %.1f", newline="")
+            f.write('"/>\n')
+        f.write("</svg>\n")
+
+
+def export_png(seg, path, size=(10, 8), dpi=100, linewidth=1.0):
+    """Раструє відрізки одним викликом LineCollection (без вікна, бекенд Agg)."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.collections import LineCollection
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=size, dpi=dpi)
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    lines = np.stack((np.column_stack((seg["x0"], seg["y0"])),
+                      np.column_stack((seg["x1"], seg["y1"]))), axis=1)
+    ax.add_collection(LineCollection(lines, colors=seg["colors"] / 255.0, linewidths=linewidth))
+    ax.autoscale()
+    ax.set_aspect("equal")
+    ax.axis("off")
+    fig.savefig(path, facecolor="white")
+
+
+# --- turtle як один із переглядачів ---
+def draw_with_turtle(seg):
+    import turtle
+
+    turtle.colormode(255)
+    turtle.title("Фрактал: дерево Піфагора")
+    turtle.setup(width=1000, height=800)
+    turtle.bgcolor("white")
+    turtle.tracer(0, 0)   # малюємо без анімації, оновлюємо екран один раз
+
+    pen = turtle.Turtle(visible=False)
+    pen.speed(0)
+    pen.hideturtle()
+    pen.pensize(2)
+    for x0, y0, x1, y1, color in zip(seg["x0"], seg["y0"], seg["x1"], seg["y1"], seg["colors"]):
+        pen.pencolor(tuple(int(c) for c in color))
+        pen.up()
+        pen.goto(x0, y0)
+        pen.down()
+        pen.goto(x1, y1)
+    turtle.update()
+    turtle.done()
+
+
+def benchmark(depths=(10, 14, 16, 18, 20), base=1e6, angle=45):
+    """
+    Швидкість побудови геометрії (гілок/с) залежно від глибини.
+    base великий, щоб правило "довжина < 2" не обрізало дерево раніше.
+    """
+    print(f"{'глибина':>7} | {'гілок':>9} | {'час':>8} | {'гілок/с':>12}")
+    for d in depths:
+        t0 = time.perf_counter()
+        seg = tree_segments(d, base, angle)
+        elapsed = time.perf_counter() - t0
+        n = len(seg["x0"])
+        print(f"{d:>7} | {n:>9} | {elapsed:>7.4f}s | {n / elapsed:>12,.0f}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Фрактал 'дерево Піфагора'.")
+    ap.add_argument("--depth", "-d", type=int, help="Рівень рекурсії")
+    ap.add_argument("--base", "-b", type=float, help="Довжина базової гілки (пікселі)")
+    ap.add_argument("--angle", "-a", type=float, help="Кут відхилення гілок у градусах")
+    ap.add_argument("--svg", help="Записати дерево у SVG-файл")
+    ap.add_argument("--png", help="Записати дерево у PNG-файл")
+    ap.add_argument("--bench", action="store_true", help="Бенчмарк гілок/с за глибиною")
+    args = ap.parse_args()
+
+    if args.bench:
+        benchmark()
+        return
 
+    headless = bool(args.svg or args.png)
+    # без параметрів у командному рядку питаємо, як і раніше
+    depth = args.depth if args.depth is not None else (
+        10 if headless else ask_int("Вкажіть рівень рекурсії (0..14)", 10))
+    base = args.base if args.base is not None else (
+        120 if headless else ask_int("Довжина базової гілки (пікселі)", 120))
+    angle = args.angle if args.angle is not None else (
+        45 if headless else ask_float("Кут відхилення гілок у градусах", 45))
+
+    seg = tree_segments(depth, base, angle)
+    if args.svg:
+        export_svg(seg, args.svg)
+        print(f"SVG: {args.svg} ({len(seg['x0'])} гілок)")
+    if args.png:
+        export_png(seg, args.png)
+        print(f"PNG: {args.png} ({len(seg['x0'])} гілок)")
+    if not headless:
+        draw_with_turtle(seg)
+
+
+if __name__ == "__main__":
+    main()
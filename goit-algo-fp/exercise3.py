@@ -2,15 +2,31 @@
 # Алгоритм Дейкстри з використанням бінарної купи (heapq)
 
 from __future__ import annotations
-from typing import Dict, List, Tuple, Any, Optional
+from typing import Dict, List, Tuple, Any, Optional, Callable, Iterable, Union
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import json
 import math
+import mmap
+import os
+import hashlib
 import heapq
+import random
+import struct
+import sys
+import tempfile
+import time
+import tracemalloc
 
 
 class Graph:
     """Зважений орієнтований/неорієнтований граф на основі списку суміжності."""
     def __init__(self) -> None:
         self.adj: Dict[Any, List[Tuple[Any, float]]] = {}
+        self._radj: Optional[Dict[Any, List[Tuple[Any, float]]]] = None
 
     def add_edge(self, u: Any, v: Any, w: float, undirected: bool = True) -> None:
         """Додає ребро u -> v з вагою w. Якщо undirected=True — також v -> u."""
@@ -18,10 +34,21 @@ class Graph:
         self.adj.setdefault(v, [])  # гарантуємо наявність вершини v у словнику
         if undirected:
             self.adj[v].append((u, w))
+        self._radj = None  # зворотні списки треба перебудувати
 
     def vertices(self):
         return self.adj.keys()
 
+    def reverse_adj(self) -> Dict[Any, List[Tuple[Any, float]]]:
+        """Списки вхідних ребер v: [(u, w), ...]; будуються раз і кешуються до змін графа."""
+        if self._radj is None:
+            radj: Dict[Any, List[Tuple[Any, float]]] = {v: [] for v in self.adj}
+            for u, nbrs in self.adj.items():
+                for v, w in nbrs:
+                    radj[v].append((u, w))
+            self._radj = radj
+        return self._radj
+
     def __repr__(self) -> str:
         lines = []
         for u, nbrs in self.adj.items():
@@ -29,15 +56,161 @@ class Graph:
         return "\n".join(lines)
 
 
+# -------------------------
+# Черги з пріоритетом із decrease-key
+# -------------------------
+class IndexedDaryHeap:
+    """
+    Індексована d-арна купа: кожна вершина присутня не більше одного разу,
+    update() зменшує ключ наявної вершини (decrease-key), тож застарілих
+    записів, як у ледачій heapq, немає. d=2 — звичайна бінарна купа.
+    """
+
+    def __init__(self, d: int = 2) -> None:
+        self.d = d
+        self.keys: List[float] = []
+        self.items: List[Any] = []
+        self.pos: Dict[Any, int] = {}
+        self.peak = 0
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def update(self, v: Any, key: float) -> None:
+        """Вставляє v з ключем key або зменшує його ключ."""
+        i = self.pos.get(v)
+        if i is None:
+            i = len(self.items)
+            self.keys.append(key)
+            self.items.append(v)
+            self.pos[v] = i
+            if i + 1 > self.peak:
+                self.peak = i + 1
+        elif key < self.keys[i]:
+            self.keys[i] = key
+        else:
+            return
+        self._sift_up(i)
+
+    def pop(self) -> Tuple[float, Any]:
+        keys, items, pos = self.keys, self.items, self.pos
+        top_key, top = keys[0], items[0]
+        del pos[top]
+        last_key, last = keys.pop(), items.pop()
+        if items:
+            keys[0], items[0] = last_key, last
+            pos[last] = 0
+            self._sift_down(0)
+        return top_key, top
+
+    def _sift_up(self, i: int) -> None:
+        keys, items, pos, d = self.keys, self.items, self.pos, self.d
+        key, item = keys[i], items[i]
+        while i > 0:
+            p = (i - 1) // d
+            if keys[p] <= key:
+                break
+            keys[i], items[i] = keys[p], items[p]
+            pos[items[i]] = i
+            i = p
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+    def _sift_down(self, i: int) -> None:
+        keys, items, pos, d = self.keys, self.items, self.pos, self.d
+        n = len(items)
+        key, item = keys[i], items[i]
+        while True:
+            first = d * i + 1
+            if first >= n:
+                break
+            best = first
+            for c in range(first + 1, min(first + d, n)):
+                if keys[c] < keys[best]:
+                    best = c
+            if keys[best] >= key:
+                break
+            keys[i], items[i] = keys[best], items[best]
+            pos[items[i]] = i
+            i = best
+        keys[i], items[i] = key, item
+        pos[item] = i
+
+
+class BucketQueue:
+    """
+    Черга Діала для цілих невід'ємних ваг не більших за max_weight:
+    циклічний масив із max_weight + 1 кошиків. Для Дейкстри всі ключі в черзі
+    лежать у [поточний мінімум, мінімум + max_weight], тож кошики не перетинаються.
+    """
+
+    def __init__(self, max_weight: int) -> None:
+        self.size = max_weight + 1
+        self.buckets: List[set] = [set() for _ in range(self.size)]
+        self.key: Dict[Any, float] = {}
+        self.cur = 0
+        self.peak = 0
+
+    def __len__(self) -> int:
+        return len(self.key)
+
+    def update(self, v: Any, key: float) -> None:
+        old = self.key.get(v)
+        if old is not None:
+            if key >= old:
+                return
+            self.buckets[int(old) % self.size].discard(v)
+        self.key[v] = key
+        self.buckets[int(key) % self.size].add(v)
+        if len(self.key) > self.peak:
+            self.peak = len(self.key)
+
+    def pop(self) -> Tuple[float, Any]:
+        buckets, size = self.buckets, self.size
+        while not buckets[self.cur % size]:
+            self.cur += 1
+        v = buckets[self.cur % size].pop()
+        return self.key.pop(v), v
+
+
+def make_priority_queue(kind: str, g: Graph):
+    """
+    Створює чергу для dijkstra_heap:
+      - "indexed" — індексована бінарна купа з decrease-key;
+      - "dary"    — індексована 4-арна купа (менша висота, дешевший decrease-key);
+      - "dial"    — кошики Діала (лише цілі невід'ємні ваги).
+    """
+    if kind == "indexed":
+        return IndexedDaryHeap(2)
+    if kind == "dary":
+        return IndexedDaryHeap(4)
+    if kind == "dial":
+        max_w = 0
+        for nbrs in g.adj.values():
+            for _, w in nbrs:
+                if w < 0 or w != int(w):
+                    raise ValueError("черга Діала потребує цілих невід'ємних ваг")
+                if w > max_w:
+                    max_w = w
+        return BucketQueue(int(max_w))
+    raise ValueError("queue має бути 'lazy', 'indexed', 'dary' або 'dial'")
+
+
 def dijkstra_heap(
-    g: Graph, source: Any
+    g: Graph, source: Any, queue: str = "lazy",
+    stats: Optional[Dict[str, int]] = None,
 ) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
     """
     Алгоритм Дейкстри з використанням бінарної купи (heapq).
     Повертає:
       - dist[v]: найкоротша відстань від source до v
       - parent[v]: попередник v у найкоротшому шляху (для відновлення маршруту)
+    queue обирає чергу: "lazy" (heapq з ледачим видаленням, за замовчуванням)
+    або одна з make_priority_queue ("indexed", "dary", "dial").
+    Якщо передано stats, у stats["peak"] записується найбільший розмір черги.
     """
+    if queue != "lazy":
+        return _dijkstra_pq(g, source, make_priority_queue(queue, g), stats)
 
     # 1) ініціалізація
     dist = {v: math.inf for v in g.vertices()}
@@ -47,6 +220,7 @@ def dijkstra_heap(
     # бінарна купа (піраміда) для вибору вершини з найменшою поточною дистанцією
     # зберігаємо пари (поточна_відстань, вершина)
     heap: List[Tuple[float, Any]] = [(0.0, source)]
+    peak = 1
 
     # 2) ітерації
     while heap:
@@ -64,7 +238,34 @@ def dijkstra_heap(
                 dist[v] = cand
                 parent[v] = u
                 heapq.heappush(heap, (cand, v))
+                if len(heap) > peak:
+                    peak = len(heap)
 
+    if stats is not None:
+        stats["peak"] = peak
+    return dist, parent
+
+
+def _dijkstra_pq(g: Graph, source: Any, pq,
+                 stats: Optional[Dict[str, int]] = None
+                 ) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+    """Дейкстра над чергою з decrease-key: кожна вершина в черзі щонайбільше раз."""
+    dist = {v: math.inf for v in g.vertices()}
+    parent: Dict[Any, Optional[Any]] = {v: None for v in g.vertices()}
+    dist[source] = 0.0
+    pq.update(source, 0.0)
+
+    while pq:
+        d_u, u = pq.pop()
+        for v, w in g.adj[u]:
+            cand = d_u + w
+            if cand < dist[v]:
+                dist[v] = cand
+                parent[v] = u
+                pq.update(v, cand)
+
+    if stats is not None:
+        stats["peak"] = pq.peak
     return dist, parent
 
 
@@ -79,10 +280,1000 @@ def reconstruct_path(parent: Dict[Any, Optional[Any]], target: Any) -> List[Any]
     return path
 
 
+# -------------------------
+# Запити "з точки в точку"
+# -------------------------
+def shortest_path(g: Graph, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """
+    Дейкстра з раннім виходом: зупиняється, щойно target знято з купи.
+    Відстані зберігаються лише для досягнутих вершин (без O(V) ініціалізації).
+    Повертає (відстань, шлях); якщо target недосяжна — (inf, []).
+    """
+    dist: Dict[Any, float] = {source: 0.0}
+    parent: Dict[Any, Optional[Any]] = {source: None}
+    heap: List[Tuple[float, int, Any]] = [(0.0, 0, source)]
+    counter = 1  # розриває нічиї, щоб не порівнювати самі вершини
+
+    while heap:
+        d_u, _, u = heapq.heappop(heap)
+        if d_u != dist[u]:
+            continue
+        if u == target:
+            return d_u, reconstruct_path(parent, target)
+        for v, w in g.adj[u]:
+            cand = d_u + w
+            if cand < dist.get(v, math.inf):
+                dist[v] = cand
+                parent[v] = u
+                heapq.heappush(heap, (cand, counter, v))
+                counter += 1
+
+    return math.inf, []
+
+
+def bidirectional_dijkstra(g: Graph, source: Any, target: Any) -> Tuple[float, List[Any]]:
+    """
+    Двонапрямлений Дейкстра: прямий пошук від source по adj і зворотний від target
+    по reverse_adj(). Щокроку розширюємо той бік, у якого менший мінімум у купі;
+    зупиняємось, коли сума мінімумів обох куп не менша за найкращий знайдений шлях.
+    Повертає (відстань, шлях) як shortest_path.
+    """
+    if source == target:
+        return 0.0, [source]
+
+    adj = (g.adj, g.reverse_adj())
+    dist: Tuple[Dict[Any, float], Dict[Any, float]] = ({source: 0.0}, {target: 0.0})
+    parent: Tuple[Dict[Any, Optional[Any]], Dict[Any, Optional[Any]]] = ({source: None}, {target: None})
+    settled: Tuple[set, set] = (set(), set())
+    heaps: Tuple[list, list] = ([(0.0, 0, source)], [(0.0, 0, target)])
+    counter = 1
+    best, meet = math.inf, None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d_u, _, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+        my_dist, other_dist = dist[side], dist[1 - side]
+        for v, w in adj[side][u]:
+            cand = d_u + w
+            if cand < my_dist.get(v, math.inf):
+                my_dist[v] = cand
+                parent[side][v] = u
+                heapq.heappush(heaps[side], (cand, counter, v))
+                counter += 1
+            if v in other_dist and cand + other_dist[v] < best:
+                best, meet = cand + other_dist[v], v
+        if u in other_dist and d_u + other_dist[u] < best:
+            best, meet = d_u + other_dist[u], u
+
+    if meet is None:
+        return math.inf, []
+    path = reconstruct_path(parent[0], meet)
+    cur = parent[1][meet]
+    while cur is not None:
+        path.append(cur)
+        cur = parent[1][cur]
+    return best, path
+
+
+# -------------------------
+# Цілеспрямований пошук: A* та ALT (landmarks)
+# -------------------------
+def astar(g: Graph, source: Any, target: Any,
+          heuristic: Callable[[Any], float],
+          stats: Optional[Dict[str, int]] = None) -> Tuple[float, List[Any]]:
+    """
+    A*: Дейкстра, у якому пріоритет вершини — dist[v] + heuristic(v).
+    heuristic(v) має бути нижньою оцінкою відстані v -> target (допустимою
+    й узгодженою), тоді результат збігається з shortest_path.
+    Якщо передано stats, у stats["settled"] записується кількість знятих вершин.
+    """
+    dist: Dict[Any, float] = {source: 0.0}
+    parent: Dict[Any, Optional[Any]] = {source: None}
+    heap: List[Tuple[float, int, float, Any]] = [(heuristic(source), 0, 0.0, source)]
+    counter = 1
+    settled = 0
+
+    try:
+        while heap:
+            _, _, d_u, u = heapq.heappop(heap)
+            if d_u != dist[u]:
+                continue
+            settled += 1
+            if u == target:
+                return d_u, reconstruct_path(parent, target)
+            for v, w in g.adj[u]:
+                cand = d_u + w
+                if cand < dist.get(v, math.inf):
+                    dist[v] = cand
+                    parent[v] = u
+                    heapq.heappush(heap, (cand + heuristic(v), counter, cand, v))
+                    counter += 1
+        return math.inf, []
+    finally:
+        if stats is not None:
+            stats["settled"] = settled
+
+
+def euclidean_heuristic(coords: Dict[Any, Tuple[float, float]], target: Any,
+                        scale: float = 1.0) -> Callable[[Any], float]:
+    """
+    Евристика за координатами вершин: scale * евклідова відстань до target.
+    Допустима, якщо вага кожного ребра не менша за scale * довжину відрізка.
+    """
+    tx, ty = coords[target]
+    return lambda v: scale * math.hypot(coords[v][0] - tx, coords[v][1] - ty)
+
+
+def _reversed_graph(g: Graph) -> Graph:
+    rg = Graph()
+    rg.adj = g.reverse_adj()
+    return rg
+
+
+class Landmarks:
+    """
+    Таблиці ALT: для кожного орієнтира L відстані d(L, v) та d(v, L) для всіх v.
+    За нерівністю трикутника d(v, t) >= max(d(L, t) - d(L, v), d(v, L) - d(t, L)).
+    """
+
+    def __init__(self, ids: List[Any], landmarks: List[Any],
+                 dist_from: List[array], dist_to: List[array],
+                 fingerprint: Optional[Dict[str, Any]] = None) -> None:
+        self.ids = ids
+        self.index: Dict[Any, int] = {v: i for i, v in enumerate(ids)}
+        self.landmarks = landmarks
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def build(cls, g: Graph, k: int = 4, seed: int = 0) -> "Landmarks":
+        """
+        Обирає k орієнтирів "найвіддаленішими точками" і рахує таблиці через
+        dijkstra_heap по графу та по графу з оберненими ребрами.
+        """
+        ids = list(g.vertices())
+        rg = _reversed_graph(g)
+        landmarks: List[Any] = []
+        dist_from: List[array] = []
+        dist_to: List[array] = []
+        closest = {v: math.inf for v in ids}  # відстань до найближчого обраного орієнтира
+        nxt = random.Random(seed).choice(ids)
+        for _ in range(min(k, len(ids))):
+            landmarks.append(nxt)
+            d_from, _ = dijkstra_heap(g, nxt)
+            d_to, _ = dijkstra_heap(rg, nxt)
+            dist_from.append(array("d", (d_from[v] for v in ids)))
+            dist_to.append(array("d", (d_to[v] for v in ids)))
+            for v in ids:
+                if d_from[v] < closest[v]:
+                    closest[v] = d_from[v]
+            # наступний — найдальша з досяжних вершин (недосяжні дають нескінченність)
+            nxt = max(ids, key=lambda v: closest[v] if not math.isinf(closest[v]) else -1.0)
+        return cls(ids, landmarks, dist_from, dist_to, landmark_fingerprint(g, k, seed))
+
+    def heuristic(self, target: Any) -> Callable[[Any], float]:
+        """Нижня оцінка відстані v -> target для astar."""
+        t = self.index[target]
+        cols = [(df, dt, df[t], dt[t]) for df, dt in zip(self.dist_from, self.dist_to)]
+        index = self.index
+
+        def h(v: Any) -> float:
+            i = index[v]
+            best = 0.0
+            for df, dt, df_t, dt_t in cols:
+                a = df_t - df[i]
+                if a > best:
+                    best = a
+                b = dt[i] - dt_t
+                if b > best:
+                    best = b
+            return best
+
+        return h
+
+    def save(self, path: str | Path) -> None:
+        """
+        Зберігає таблиці на диск, щоб не перераховувати їх при кожному запуску.
+        Формат: _ALT_MAGIC, довжина JSON-заголовка (ids, орієнтири, відбиток графа),
+        заголовок, далі стовпці dist_from і dist_to як сирі float64.
+        """
+        header = json.dumps({
+            "ids": [_json_id(v) for v in self.ids],
+            "landmarks": [_json_id(v) for v in self.landmarks],
+            "fingerprint": self.fingerprint,
+        }).encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(_ALT_MAGIC + struct.pack("<Q", len(header)) + header)
+            for col in self.dist_from + self.dist_to:
+                col.tofile(f)
+
+    @classmethod
+    def load(cls, path: str | Path, g: Optional[Graph] = None,
+             k: Optional[int] = None, seed: Optional[int] = None) -> "Landmarks":
+        """
+        Завантажує таблиці, збережені save(). Якщо передано g (і k/seed),
+        відбиток файлу звіряється з графом: таблиці від іншого графа дали б
+        евристику, що може переоцінювати відстані, і A* повернув би хибні шляхи.
+        Невідповідність або пошкоджений файл — ValueError.
+        """
+        raw = Path(path).read_bytes()
+        prefix = len(_ALT_MAGIC) + 8
+        if len(raw) < prefix or raw[:len(_ALT_MAGIC)] != _ALT_MAGIC:
+            raise ValueError(f"{path}: не файл орієнтирів")
+        (hlen,) = struct.unpack_from("<Q", raw, len(_ALT_MAGIC))
+        header = json.loads(raw[prefix:prefix + hlen].decode("utf-8"))
+        ids = [_from_json_id(v) for v in header["ids"]]
+        landmarks = [_from_json_id(v) for v in header["landmarks"]]
+        fingerprint = header["fingerprint"]
+        n, count = len(ids), len(landmarks)
+        body = memoryview(raw)[prefix + hlen:]
+        if len(body) != 2 * count * n * 8:
+            raise ValueError(f"{path}: очікувалося {2 * count * n * 8} байтів таблиць, є {len(body)}")
+        if g is not None:
+            expected = landmark_fingerprint(g, fingerprint.get("k") if k is None else k,
+                                            fingerprint.get("seed") if seed is None else seed)
+            if fingerprint != expected:
+                raise ValueError(f"{path}: орієнтири побудовані для іншого графа або параметрів")
+
+        cols = []
+        for j in range(2 * count):
+            col = array("d")
+            col.frombytes(body[j * n * 8:(j + 1) * n * 8])
+            cols.append(col)
+        return cls(ids, landmarks, cols[:count], cols[count:], fingerprint)
+
+
+_ALT_MAGIC = b"ALT1"
+
+
+def _json_id(v: Any) -> Any:
+    # кортежі (вершини решітки) у JSON стають списками — при читанні повертаємо назад
+    return [_json_id(x) for x in v] if isinstance(v, tuple) else v
+
+
+def _from_json_id(v: Any) -> Any:
+    return tuple(_from_json_id(x) for x in v) if isinstance(v, list) else v
+
+
+def landmark_fingerprint(g: Graph, k: Optional[int], seed: Optional[int]) -> Dict[str, Any]:
+    """Відбиток графа (n, m, хеш ребер у порядку суміжності) і параметрів побудови орієнтирів."""
+    h = hashlib.blake2b(digest_size=16)
+    m = 0
+    for u, nbrs in g.adj.items():
+        h.update(repr((u, nbrs)).encode("utf-8"))
+        m += len(nbrs)
+    return {"n": len(g.adj), "m": m, "edges": h.hexdigest(), "k": k, "seed": seed}
+
+
+# -------------------------
+# Компактне подання CSR (compressed sparse row)
+# -------------------------
+class CSRGraph:
+    """
+    Незмінний граф у форматі CSR. Вершини пронумеровані 0..n-1:
+      - ids[i]      — початковий ідентифікатор вершини i;
+      - index[v]    — номер вершини v;
+      - offsets     — ребра вершини u займають позиції offsets[u]..offsets[u+1]-1;
+      - targets     — кінці ребер (номери вершин), array('q');
+      - weights     — ваги ребер, array('d').
+    Масиви можуть бути й memoryview над mmap (див. open_binary_graph).
+    """
+    __slots__ = ("ids", "index", "offsets", "targets", "weights", "_buffer")
+
+    def __init__(self, ids: List[Any], offsets: array, targets: array, weights: array,
+                 index: Optional[Any] = None, buffer: Optional[Any] = None) -> None:
+        self.ids = ids
+        self.index = index if index is not None else {v: i for i, v in enumerate(ids)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._buffer = buffer  # тримає mmap відкритим, поки живий граф
+
+    @classmethod
+    def from_graph(cls, g: Graph) -> "CSRGraph":
+        """Перетворює Graph (словник списків) у CSR."""
+        ids = list(g.vertices())
+        index = {v: i for i, v in enumerate(ids)}
+        offsets = array("q", [0])
+        targets = array("q")
+        weights = array("d")
+        for u in ids:
+            for v, w in g.adj[u]:
+                targets.append(index[v])
+                weights.append(w)
+            offsets.append(len(targets))
+        return cls(ids, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Tuple[Any, Any, float]],
+                   undirected: bool = True) -> "CSRGraph":
+        """
+        Будує CSR напряму з потоку ребер (u, v, w), минаючи Graph.
+        Вершини нумеруються в порядку першої появи, як після add_edge + from_graph.
+        """
+        index: Dict[Any, int] = {}
+        ids: List[Any] = []
+        src, dst, wts = array("q"), array("q"), array("d")
+        add_src, add_dst, add_w = src.append, dst.append, wts.append
+        for u, v, w in edges:
+            iu = index.get(u)
+            if iu is None:
+                iu = index[u] = len(ids)
+                ids.append(u)
+            iv = index.get(v)
+            if iv is None:
+                iv = index[v] = len(ids)
+                ids.append(v)
+            add_src(iu)
+            add_dst(iv)
+            add_w(w)
+        if undirected:
+            src, dst, wts = src + dst, dst + src, wts + wts
+
+        # сортування підрахунком за початком дуги: offsets з кількостей, потім
+        # кожна дуга розкладається у свій слот — O(n + m), стабільно, без списку індексів
+        n, m = len(ids), len(src)
+        offsets = array("q", bytes(8 * (n + 1)))
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        slot = offsets[:-1]
+        targets = array("q", bytes(8 * m))
+        weights = array("d", bytes(8 * m))
+        for u, v, w in zip(src, dst, wts):
+            p = slot[u]
+            targets[p] = v
+            weights[p] = w
+            slot[u] = p + 1
+        return cls(ids, offsets, targets, weights, index=index)
+
+    def num_vertices(self) -> int:
+        return len(self.ids)
+
+    def num_edges(self) -> int:
+        return len(self.targets)
+
+    def neighbors(self, u: int):
+        """Пари (номер сусіда, вага) для вершини з номером u."""
+        lo, hi = self.offsets[u], self.offsets[u + 1]
+        return zip(self.targets[lo:hi], self.weights[lo:hi])
+
+    def __repr__(self) -> str:
+        return f"CSRGraph(n={self.num_vertices()}, m={self.num_edges()})"
+
+
+# -------------------------
+# Масове завантаження: текстовий список ребер і бінарний формат
+# -------------------------
+def iter_edge_list(path: str | Path, delimiter: Optional[str] = None,
+                   vertex_type: Callable[[str], Any] = str) -> Iterable[Tuple[Any, Any, float]]:
+    """
+    Потоково читає рядки "u v w" (або CSV "u,v,w"). Порожні рядки та рядки,
+    що починаються з #, пропускаються; перший рядок даних з нечисловою вагою
+    вважається заголовком і теж пропускається.
+    Якщо delimiter не задано, підходить і кома, і пробільні символи.
+    """
+    with open(path, encoding="utf-8") as f:
+        first = True
+        for lineno, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            header, first = first, False
+            parts = line.split(delimiter) if delimiter else line.replace(",", " ").split()
+            if len(parts) < 3:
+                raise ValueError(f"{path}:{lineno}: очікується 'u v w', отримано {line!r}")
+            try:
+                w = float(parts[2])
+            except ValueError:
+                if header:
+                    continue  # заголовок CSV (можливо, після коментарів)
+                raise ValueError(f"{path}:{lineno}: вага {parts[2]!r} не є числом") from None
+            yield vertex_type(parts[0].strip()), vertex_type(parts[1].strip()), w
+
+
+def load_edge_list(path: str | Path, undirected: bool = True, **kwargs) -> CSRGraph:
+    """Список ребер з файлу -> CSRGraph без проміжного словника списків."""
+    return CSRGraph.from_edges(iter_edge_list(path, **kwargs), undirected=undirected)
+
+
+# Формат файлу (little-endian): заголовок 32 байти, далі offsets (n+1 x int64),
+# targets (m x int64), weights (m x float64) і, якщо ids не 0..n-1, JSON-список ids.
+_BIN_MAGIC = b"CSRG"
+_BIN_VERSION = 1
+_BIN_HEADER = struct.Struct("<4sIIIqq")  # magic, version, flags, резерв, n, m
+_FLAG_IDENTITY_IDS = 1
+
+
+class _IdentityIndex:
+    """index для вершин 0..n-1: номер вершини дорівнює її ідентифікатору."""
+    __slots__ = ("n",)
+
+    def __init__(self, n: int) -> None:
+        self.n = n
+
+    def __getitem__(self, v: Any) -> int:
+        if isinstance(v, int) and 0 <= v < self.n:
+            return v
+        raise KeyError(v)
+
+    def __contains__(self, v: Any) -> bool:
+        return isinstance(v, int) and 0 <= v < self.n
+
+
+def save_binary_graph(g: CSRGraph, path: str | Path) -> None:
+    """Записує CSRGraph у компактний бінарний файл для open_binary_graph."""
+    n, m = g.num_vertices(), g.num_edges()
+    identity = all(isinstance(v, int) and v == i for i, v in enumerate(g.ids))
+    # ids серіалізуємо до відкриття файла: якщо JSON їх не прийме, на диску не лишиться обрізка
+    ids_blob = b"" if identity else json.dumps([_json_id(v) for v in g.ids]).encode("utf-8")
+    with open(path, "wb") as f:
+        f.write(_BIN_HEADER.pack(_BIN_MAGIC, _BIN_VERSION,
+                                 _FLAG_IDENTITY_IDS if identity else 0, 0, n, m))
+        for col, code in ((g.offsets, "q"), (g.targets, "q"), (g.weights, "d")):
+            data = col if isinstance(col, array) else array(code, col)
+            if sys.byteorder != "little":
+                data = array(code, data)
+                data.byteswap()
+            data.tofile(f)
+        f.write(ids_blob)
+
+
+def open_binary_graph(path: str | Path) -> CSRGraph:
+    """
+    Відкриває файл save_binary_graph через mmap: масиви — це memoryview над
+    відображеним файлом, тож нічого не копіюється і граф готовий за мілісекунди
+    (dijkstra_heap_csr працює з ним напряму). Для вершин 0..n-1 не будується
+    навіть словник index.
+    """
+    if sys.byteorder != "little":
+        raise OSError("open_binary_graph підтримує лише little-endian платформи")
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _BIN_HEADER.size:
+            raise ValueError(f"{path}: файл коротший за заголовок бінарного графа")
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, version, flags, _, n, m = _BIN_HEADER.unpack_from(mm, 0)
+    if magic != _BIN_MAGIC or version != _BIN_VERSION:
+        mm.close()
+        raise ValueError(f"{path}: це не бінарний граф версії {_BIN_VERSION}")
+    # розмір перевіряємо до cast: обрізаний файл інакше відкрився б з короткими масивами
+    expected = _BIN_HEADER.size + 8 * (n + 1) + 16 * m
+    identity = bool(flags & _FLAG_IDENTITY_IDS)
+    if n < 0 or m < 0 or len(mm) < expected or (identity and len(mm) != expected):
+        size = len(mm)
+        mm.close()
+        raise ValueError(f"{path}: {size} байтів не відповідає заголовку (n={n}, m={m}, "
+                         f"потрібно {expected}{'' if identity else ' + ids'})")
+    view = memoryview(mm)
+    pos = _BIN_HEADER.size
+    offsets = view[pos:pos + 8 * (n + 1)].cast("q")
+    pos += 8 * (n + 1)
+    targets = view[pos:pos + 8 * m].cast("q")
+    pos += 8 * m
+    weights = view[pos:pos + 8 * m].cast("d")
+    pos += 8 * m
+    if identity:
+        ids: Any = range(n)
+        index: Any = _IdentityIndex(n)
+    else:
+        ids = [_from_json_id(v) for v in json.loads(bytes(view[pos:]).decode("utf-8"))]
+        index = None
+    return CSRGraph(ids, offsets, targets, weights, index=index, buffer=mm)
+
+
+def dijkstra_heap_csr(g: CSRGraph, source: Any) -> Tuple[List[float], List[int]]:
+    """
+    Дейкстра на CSRGraph. dist і parent — списки, індексовані номерами вершин
+    (parent[v] == -1, якщо попередника немає). source — початковий ідентифікатор.
+    """
+    return _dijkstra_csr(g.offsets, g.targets, g.weights, g.index[source])
+
+
+def _dijkstra_csr(offsets, targets, weights, s: int) -> Tuple[List[float], List[int]]:
+    """Ядро Дейкстри на масивах CSR; s — номер джерела."""
+    n = len(offsets) - 1
+    dist = [math.inf] * n
+    parent = [-1] * n
+    dist[s] = 0.0
+    heap: List[Tuple[float, int]] = [(0.0, s)]
+
+    while heap:
+        d_u, u = heapq.heappop(heap)
+        if d_u != dist[u]:
+            continue
+        lo, hi = offsets[u], offsets[u + 1]
+        for v, w in zip(targets[lo:hi], weights[lo:hi]):
+            cand = d_u + w
+            if cand < dist[v]:
+                dist[v] = cand
+                parent[v] = u
+                heapq.heappush(heap, (cand, v))
+
+    return dist, parent
+
+
+def reconstruct_path_csr(g: CSRGraph, parent: List[int], target: Any) -> List[Any]:
+    """Відновлює шлях (у початкових ідентифікаторах) за масивом parent з dijkstra_heap_csr."""
+    path = []
+    cur = g.index[target]
+    while cur != -1:
+        path.append(g.ids[cur])
+        cur = parent[cur]
+    path.reverse()
+    return path
+
+
+# -------------------------
+# Матриця відстаней "багато-до-багатьох"
+# -------------------------
+# Стан процесу-працівника: масиви CSR і номери цільових вершин.
+# Заповнюється один раз в ініціалізаторі, а не передається з кожним завданням.
+_WORKER_STATE: Optional[Tuple[array, array, array, List[int]]] = None
+
+
+def _from_bytes(typecode: str, raw: bytes) -> array:
+    col = array(typecode)
+    col.frombytes(raw)
+    return col
+
+
+def _init_matrix_worker(offsets: bytes, targets: bytes, weights: bytes,
+                        columns: List[int]) -> None:
+    global _WORKER_STATE
+    _WORKER_STATE = (_from_bytes("q", offsets), _from_bytes("q", targets),
+                     _from_bytes("d", weights), columns)
+
+
+def _matrix_rows(sources: List[int]) -> List[array]:
+    return _rows_for(_WORKER_STATE, sources)
+
+
+def _rows_for(state: Tuple[Any, Any, Any, List[int]], sources: List[int]) -> List[array]:
+    offsets, targets, weights, columns = state
+    rows = []
+    for s in sources:
+        dist, _ = _dijkstra_csr(offsets, targets, weights, s)
+        rows.append(array("d", (dist[t] for t in columns)))
+    return rows
+
+
+def distance_matrix(g: Union[Graph, CSRGraph], sources: Iterable[Any],
+                    targets: Optional[Iterable[Any]] = None,
+                    workers: int = 1, chunksize: int = 4) -> List[array]:
+    """
+    Щільна матриця найкоротших відстаней: рядок i — джерело sources[i],
+    стовпець j — ціль targets[j] (за замовчуванням усі вершини), array('d').
+    Граф переводиться у CSR і передається кожному процесу один раз
+    (сирі байти масивів через initializer); завдання — лише пакети номерів джерел.
+    """
+    csr = g if isinstance(g, CSRGraph) else CSRGraph.from_graph(g)
+    src = [csr.index[v] for v in sources]
+    cols = list(range(csr.num_vertices())) if targets is None else [csr.index[v] for v in targets]
+    if workers <= 1:
+        return _rows_for((csr.offsets, csr.targets, csr.weights, cols), src)
+
+    state = (csr.offsets.tobytes(), csr.targets.tobytes(), csr.weights.tobytes(), cols)
+    batches = [src[i:i + chunksize] for i in range(0, len(src), chunksize)]
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_matrix_worker,
+                             initargs=state) as pool:
+        return [row for rows in pool.map(_matrix_rows, batches) for row in rows]
+
+
+# -------------------------
+# Кеш дерев найкоротших шляхів з інкрементним оновленням
+# -------------------------
+class ShortestPathCache:
+    """
+    LRU-кеш результатів dijkstra_heap за джерелом (не більше maxsize дерев).
+    Зміни графа треба робити через add_edge / decrease_weight цього кешу:
+    тоді кешовані дерева не перераховуються, а ремонтуються від кінців
+    покращених ребер (зменшення ваг лише зменшує відстані, тож достатньо
+    Дейкстри з купою, заповненою цими вершинами).
+    Лічильники: hits, misses, repairs (відремонтовані дерева), invalidations.
+    """
+
+    def __init__(self, g: Graph, maxsize: int = 128) -> None:
+        self.g = g
+        self.maxsize = maxsize
+        self._trees: "OrderedDict[Any, Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.repairs = 0
+        self.invalidations = 0
+
+    def get(self, source: Any) -> Tuple[Dict[Any, float], Dict[Any, Optional[Any]]]:
+        """(dist, parent) для source. Словники належать кешу — не змінюйте їх."""
+        tree = self._trees.get(source)
+        if tree is not None:
+            self.hits += 1
+            self._trees.move_to_end(source)
+            return tree
+        self.misses += 1
+        tree = dijkstra_heap(self.g, source)
+        self._trees[source] = tree
+        if len(self._trees) > self.maxsize:
+            self._trees.popitem(last=False)
+        return tree
+
+    def shortest_path(self, source: Any, target: Any) -> Tuple[float, List[Any]]:
+        dist, parent = self.get(source)
+        if math.isinf(dist.get(target, math.inf)):
+            return math.inf, []
+        return dist[target], reconstruct_path(parent, target)
+
+    def add_edge(self, u: Any, v: Any, w: float, undirected: bool = True) -> None:
+        """Додає ребро в граф і ремонтує всі кешовані дерева."""
+        self.g.add_edge(u, v, w, undirected)
+        arcs = [(u, v, w), (v, u, w)] if undirected else [(u, v, w)]
+        self._repair_all(arcs)
+
+    def decrease_weight(self, u: Any, v: Any, w: float, undirected: bool = True) -> None:
+        """
+        Зменшує вагу наявного ребра u -> v (та v -> u, якщо undirected) до w.
+        Збільшення ваги може подовжити шляхи — тоді кеш просто очищується.
+        """
+        arcs = [(u, v)] + ([(v, u)] if undirected else [])
+        # спершу знаходимо всі дуги (і паралельні), щоб помилка не лишила граф змінено наполовину
+        found = []
+        for a, b in arcs:
+            nbrs = self.g.adj.get(a, [])
+            idx = [i for i, (x, _) in enumerate(nbrs) if x == b]
+            if not idx:
+                raise KeyError(f"ребра {a} -> {b} немає в графі")
+            found.append((nbrs, idx, b))
+        increased = False
+        for nbrs, idx, b in found:
+            for i in idx:
+                increased = increased or w > nbrs[i][1]
+                nbrs[i] = (b, w)
+        self.g._radj = None
+        if increased:
+            self.invalidate()
+        else:
+            self._repair_all([(a, b, w) for a, b in arcs])
+
+    def invalidate(self) -> None:
+        if self._trees:
+            self.invalidations += 1
+        self._trees.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {"size": len(self._trees), "hits": self.hits, "misses": self.misses,
+                "repairs": self.repairs, "invalidations": self.invalidations}
+
+    def _repair_all(self, arcs: List[Tuple[Any, Any, float]]) -> None:
+        for dist, parent in self._trees.values():
+            if _repair_tree(self.g, dist, parent, arcs):
+                self.repairs += 1
+
+
+def _repair_tree(g: Graph, dist: Dict[Any, float], parent: Dict[Any, Optional[Any]],
+                 arcs: List[Tuple[Any, Any, float]]) -> bool:
+    """
+    Інкрементний Дейкстра після покращення дуг arcs = [(u, v, w), ...].
+    Перераховує лише вершини, чия відстань зменшилась. Повертає True, якщо дерево змінилось.
+    """
+    heap: List[Tuple[float, int, Any]] = []
+    counter = 0
+    for u, v, w in arcs:
+        for x in (u, v):
+            if x not in dist:  # нова вершина
+                dist[x] = math.inf
+                parent[x] = None
+        cand = dist[u] + w
+        if cand < dist[v]:
+            dist[v] = cand
+            parent[v] = u
+            heap.append((cand, counter, v))
+            counter += 1
+    if not heap:
+        return False
+    heapq.heapify(heap)
+    while heap:
+        d_u, _, u = heapq.heappop(heap)
+        if d_u != dist[u]:
+            continue
+        for v, w in g.adj[u]:
+            cand = d_u + w
+            if cand < dist[v]:
+                dist[v] = cand
+                parent[v] = u
+                heapq.heappush(heap, (cand, counter, v))
+                counter += 1
+    return True
+
+
+# -------------------------
+# Бенчмарки
+# -------------------------
+def random_graph(n: int, m: int, seed: int = 12345, max_w: int = 100,
+                 float_weights: bool = False) -> Graph:
+    """Випадковий зв'язний неорієнтований граф: кістякове дерево + випадкові ребра."""
+    rng = random.Random(seed)
+    weight = (lambda: rng.uniform(1, max_w)) if float_weights else (lambda: rng.randint(1, max_w))
+    g = Graph()
+    for v in range(1, n):
+        g.add_edge(rng.randrange(v), v, weight())
+    for _ in range(max(0, m - (n - 1))):
+        g.add_edge(rng.randrange(n), rng.randrange(n), weight())
+    return g
+
+
+def _traced(build):
+    tracemalloc.start()
+    obj = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, current
+
+
+def benchmark_csr(n: int = 50_000, m: int = 200_000, queries: int = 20) -> None:
+    """Пам'ять на ребро і запити/с: Graph (dict) vs CSRGraph."""
+    g, g_bytes = _traced(lambda: random_graph(n, m))
+    csr, csr_bytes = _traced(lambda: CSRGraph.from_graph(g))
+    arcs = csr.num_edges()
+    sources = random.Random(1).sample(range(n), queries)
+
+    t0 = time.perf_counter()
+    for s in sources:
+        dijkstra_heap(g, s)
+    t_dict = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for s in sources:
+        dijkstra_heap_csr(csr, s)
+    t_csr = time.perf_counter() - t0
+
+    print(f"n = {n}, дуг = {arcs}, запитів = {queries}")
+    print(f"{'подання':<8} | {'байт/дугу':>9} | {'запитів/с':>9}")
+    print(f"{'dict':<8} | {g_bytes / arcs:>9.1f} | {queries / t_dict:>9.2f}")
+    print(f"{'CSR':<8} | {csr_bytes / arcs:>9.1f} | {queries / t_csr:>9.2f}")
+
+
+def benchmark_point_to_point(n: int = 50_000, m: int = 200_000, pairs: int = 50) -> None:
+    """Випадкові пари: повний dijkstra_heap vs ранній вихід vs двонапрямлений пошук."""
+    g = random_graph(n, m)
+    g.reverse_adj()  # будується один раз, не входить у час запитів
+    rng = random.Random(7)
+    queries = [(rng.randrange(n), rng.randrange(n)) for _ in range(pairs)]
+
+    def full(s, t):
+        dist, parent = dijkstra_heap(g, s)
+        return dist[t], reconstruct_path(parent, t)
+
+    print(f"n = {n}, m = {m}, пар = {pairs}")
+    print(f"{'алгоритм':<24} | {'мс/запит':>9}")
+    reference = None
+    for name, fn in (("dijkstra_heap (повний)", full),
+                     ("shortest_path", lambda s, t: shortest_path(g, s, t)),
+                     ("bidirectional_dijkstra", lambda s, t: bidirectional_dijkstra(g, s, t))):
+        t0 = time.perf_counter()
+        dists = [fn(s, t)[0] for s, t in queries]
+        elapsed = time.perf_counter() - t0
+        if reference is None:
+            reference = dists
+        assert dists == reference, f"{name}: відстані не збігаються"
+        print(f"{name:<24} | {elapsed / pairs * 1000:>9.2f}")
+
+
+def grid_graph(side: int, seed: int = 12345) -> Tuple[Graph, Dict[Any, Tuple[float, float]]]:
+    """
+    Решітка side x side зі зсунутими координатами (подібна до дорожньої мережі).
+    Вага ребра — евклідова довжина, помножена на випадковий коефіцієнт з [1, 1.5].
+    """
+    rng = random.Random(seed)
+    coords = {(i, j): (i + rng.uniform(-0.3, 0.3), j + rng.uniform(-0.3, 0.3))
+              for i in range(side) for j in range(side)}
+    g = Graph()
+    for (i, j), (x, y) in coords.items():
+        for nb in ((i + 1, j), (i, j + 1)):
+            if nb in coords:
+                nx_, ny_ = coords[nb]
+                g.add_edge((i, j), nb, math.hypot(nx_ - x, ny_ - y) * rng.uniform(1.0, 1.5))
+    return g, coords
+
+
+def benchmark_goal_directed(side: int = 150, pairs: int = 30, k: int = 8,
+                            cache: Optional[str | Path] = None) -> None:
+    """
+    Кількість знятих вершин і затримка: Дейкстра vs A* (координати) vs ALT.
+    cache — файл таблиць орієнтирів: використовується, лише якщо його відбиток
+    збігається з цим графом і k, інакше таблиці перебудовуються й перезаписуються.
+    Без cache таблиці зберігаються у тимчасовий каталог, щоб показати час читання.
+    """
+    g, coords = grid_graph(side)
+    t0 = time.perf_counter()
+    lm = None
+    if cache is not None and Path(cache).exists():
+        try:
+            lm = Landmarks.load(cache, g, k=k, seed=0)
+            how = f"завантажено з {cache}"
+        except ValueError as e:
+            print(f"Кеш орієнтирів відкинуто: {e}")
+    if lm is None:
+        lm = Landmarks.build(g, k=k)
+        how = "побудовано"
+        if cache is not None:
+            lm.save(cache)
+            how += f" й збережено в {cache}"
+    print(f"Орієнтири ({len(lm.landmarks)}): {how} за {time.perf_counter() - t0:.2f}s")
+    if cache is None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "landmarks.alt"
+            lm.save(path)
+            t0 = time.perf_counter()
+            Landmarks.load(path, g, k=k, seed=0)
+            print(f"Читання збережених таблиць з перевіркою: {time.perf_counter() - t0:.2f}s")
+
+    rng = random.Random(7)
+    vs = list(g.vertices())
+    queries = [(rng.choice(vs), rng.choice(vs)) for _ in range(pairs)]
+    variants = [
+        ("Dijkstra", lambda t: (lambda v: 0.0)),
+        ("A* (евклід)", lambda t: euclidean_heuristic(coords, t)),
+        ("ALT", lm.heuristic),
+    ]
+    print(f"решітка {side}x{side}, пар = {pairs}")
+    print(f"{'алгоритм':<12} | {'знято вершин':>12} | {'мс/запит':>9}")
+    reference = None
+    for name, make_h in variants:
+        stats: Dict[str, int] = {}
+        settled = 0
+        dists = []
+        t0 = time.perf_counter()
+        for s_, t_ in queries:
+            d, _ = astar(g, s_, t_, make_h(t_), stats)
+            dists.append(d)
+            settled += stats["settled"]
+        elapsed = time.perf_counter() - t0
+        if reference is None:
+            reference = dists
+        assert all(abs(a - b) < 1e-9 for a, b in zip(dists, reference)), f"{name}: відстані не збігаються"
+        print(f"{name:<12} | {settled / pairs:>12.0f} | {elapsed / pairs * 1000:>9.2f}")
+
+
+def benchmark_matrix(n: int = 20_000, m: int = 80_000, depots: int = 64,
+                     workers: Iterable[int] = (1, 2, 4)) -> None:
+    """Час distance_matrix для depots x depots залежно від кількості процесів."""
+    g = random_graph(n, m)
+    csr = CSRGraph.from_graph(g)
+    pts = random.Random(3).sample(range(n), depots)
+    print(f"n = {n}, m = {m}, матриця {depots}x{depots}, ядер: {os.cpu_count()}")
+    print(f"{'процесів':>8} | {'час':>8} | {'прискорення':>11}")
+    base = None
+    reference = None
+    for w in workers:
+        t0 = time.perf_counter()
+        mat = distance_matrix(csr, pts, pts, workers=w)
+        elapsed = time.perf_counter() - t0
+        if reference is None:
+            base, reference = elapsed, mat
+        assert mat == reference, "результати процесів не збігаються"
+        print(f"{w:>8} | {elapsed:>7.2f}s | {base / elapsed:>10.2f}x")
+
+
+def benchmark_cache(n: int = 20_000, m: int = 80_000, sources: int = 16,
+                    rounds: int = 200, seed: int = 5) -> None:
+    """Запити вперемішку з додаванням ребер: перерахунок з нуля vs ShortestPathCache."""
+    rng = random.Random(seed)
+    pool = rng.sample(range(n), sources)
+    ops = []
+    for _ in range(rounds):
+        if rng.random() < 0.2:
+            ops.append(("edge", rng.randrange(n), rng.randrange(n), rng.randint(1, 100)))
+        else:
+            ops.append(("query", rng.choice(pool), rng.randrange(n)))
+
+    g = random_graph(n, m)
+    t0 = time.perf_counter()
+    plain = []
+    for op in ops:
+        if op[0] == "edge":
+            g.add_edge(*op[1:])
+        else:
+            dist, _ = dijkstra_heap(g, op[1])
+            plain.append(dist[op[2]])
+    t_plain = time.perf_counter() - t0
+
+    cache = ShortestPathCache(random_graph(n, m), maxsize=sources)
+    t0 = time.perf_counter()
+    cached = []
+    for op in ops:
+        if op[0] == "edge":
+            cache.add_edge(*op[1:])
+        else:
+            cached.append(cache.get(op[1])[0][op[2]])
+    t_cache = time.perf_counter() - t0
+
+    assert plain == cached, "кеш повернув іншу відстань"
+    print(f"n = {n}, m = {m}, операцій = {rounds}")
+    print(f"з нуля: {t_plain:.2f}s, з кешем: {t_cache:.2f}s")
+    print("лічильники:", cache.stats())
+
+
+def benchmark_queues(sources: int = 5) -> None:
+    """Пікова довжина черги й час: heapq (ледача) vs індексовані купи vs кошики Діала."""
+    cases = [
+        ("розріджений, цілі", random_graph(20_000, 80_000)),
+        ("розріджений, дробові", random_graph(20_000, 80_000, float_weights=True)),
+        ("щільний, цілі", random_graph(1_500, 600_000)),
+        ("щільний, дробові", random_graph(1_500, 600_000, float_weights=True)),
+    ]
+    print(f"{'граф':<22} | {'черга':<8} | {'пік черги':>9} | {'мс/запуск':>9}")
+    for name, g in cases:
+        srcs = random.Random(1).sample(list(g.vertices()), sources)
+        reference = None
+        for kind in ("lazy", "indexed", "dary", "dial"):
+            if kind == "dial" and "дробові" in name:
+                continue
+            stats: Dict[str, int] = {}
+            peak = 0
+            results = []
+            t0 = time.perf_counter()
+            for s_ in srcs:
+                results.append(dijkstra_heap(g, s_, queue=kind, stats=stats)[0])
+                peak = max(peak, stats["peak"])
+            elapsed = time.perf_counter() - t0
+            if reference is None:
+                reference = results
+            assert all(abs(a[v] - b[v]) < 1e-9 for a, b in zip(results, reference) for v in a), \
+                f"{kind}: відстані не збігаються"
+            print(f"{name:<22} | {kind:<8} | {peak:>9} | {elapsed / sources * 1000:>9.1f}")
+
+
+def benchmark_loading(n: int = 100_000, m: int = 400_000) -> None:
+    """Завантаження графа: add_edge з тексту vs from_edges vs mmap бінарного файлу."""
+    g = random_graph(n, m)
+    with tempfile.TemporaryDirectory() as tmp:
+        txt = Path(tmp) / "edges.txt"
+        binary = Path(tmp) / "graph.csrg"
+        with open(txt, "w", encoding="utf-8") as f:
+            f.write("u,v,w\n")
+            for u, nbrs in g.adj.items():
+                for v, w in nbrs:
+                    if u <= v:  # неорієнтовані ребра записуємо один раз
+                        f.write(f"{u},{v},{w}\n")
+
+        t0 = time.perf_counter()
+        g2 = Graph()
+        for u, v, w in iter_edge_list(txt, vertex_type=int):
+            g2.add_edge(u, v, w)
+        t_graph = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        csr = load_edge_list(txt, vertex_type=int)
+        t_csr = time.perf_counter() - t0
+
+        save_binary_graph(csr, binary)
+        t0 = time.perf_counter()
+        mapped = open_binary_graph(binary)
+        t_open = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        dist, _ = dijkstra_heap_csr(mapped, 0)
+        t_query = time.perf_counter() - t0
+
+        ref, _ = dijkstra_heap(g2, 0)
+        assert all(dist[mapped.index[v]] == ref[v] for v in g2.vertices()), "відстані не збігаються"
+        size_mb = binary.stat().st_size / 2**20
+        print(f"n = {n}, m = {m} ({txt.stat().st_size / 2**20:.1f} МБ тексту, {size_mb:.1f} МБ бінарного)")
+        print(f"текст -> Graph (add_edge):      {t_graph:8.3f}s")
+        print(f"текст -> CSRGraph (from_edges): {t_csr:8.3f}s")
+        print(f"mmap бінарного файлу:           {t_open * 1000:8.3f} мс")
+        print(f"перший dijkstra_heap_csr:       {t_query:8.3f}s")
+        del mapped, dist
+
+
 # -------------------------
 # Демонстрація роботи модуля
 # -------------------------
-if __name__ == "__main__":
+def demo() -> None:
     # Створимо невеликий граф
     g = Graph()
     edges = [
@@ -115,3 +1306,26 @@ if __name__ == "__main__":
         else:
             pretty = " -> ".join(p)
             print(f"  {v}: {pretty}  (вартість {dist[v]:.2f})")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Алгоритм Дейкстри з бінарною купою.")
+    ap.add_argument("--bench", choices=["csr", "p2p", "goal", "matrix", "cache", "queues", "load"], help="Запустити бенчмарк замість демонстрації")
+    ap.add_argument("--landmarks", help="Файл таблиць орієнтирів для --bench goal (перевіряється відбиток графа)")
+    args = ap.parse_args()
+    if args.bench == "csr":
+        benchmark_csr()
+    elif args.bench == "p2p":
+        benchmark_point_to_point()
+    elif args.bench == "goal":
+        benchmark_goal_directed(cache=args.landmarks)
+    elif args.bench == "matrix":
+        benchmark_matrix()
+    elif args.bench == "cache":
+        benchmark_cache()
+    elif args.bench == "queues":
+        benchmark_queues()
+    elif args.bench == "load":
+        benchmark_loading()
+    else:
+        demo()
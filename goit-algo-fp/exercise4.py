@@ -1,7 +1,18 @@
+import argparse
+import operator
+import random
 import uuid
 import heapq
+import time
+import numpy as np
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+from tree_traversal import preorder
+
+# до якого розміру купи малювати через networkx (з підписами у великих вузлах)
+NX_LIMIT = 63
 
 
 class Node:
@@ -14,18 +25,18 @@ class Node:
 
 
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    if node is not None:
+    # прямий обхід з tree_traversal (без рекурсії): батько йде раніше за дітей,
+    # тож його координати вже відомі
+    place = {node.id: (x, y, layer)} if node is not None else {}
+    for node in preorder(node):
+        x, y, layer = place.pop(node.id)
         graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            l = add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            r = add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+        for child, side in ((node.right, 1), (node.left, -1)):
+            if child:
+                graph.add_edge(node.id, child.id)
+                cx = x + side / 2 ** layer
+                pos[child.id] = (cx, y - 1)
+                place[child.id] = (cx, y - 1, layer + 1)
     return graph
 
 
@@ -45,6 +56,222 @@ def draw_tree(tree_root, figsize=(8, 5), title=None):
     plt.show()
 
 
+# --------- Купа на масиві: мін/макс, ключ, лічильники операцій ---------
+class Heap:
+    """
+    Бінарна купа на масиві. kind — 'min' або 'max', key — функція ключа
+    (обчислюється один раз на елемент). Значення не мусять бути числами:
+    для макс-купи нічого не інвертується. count=True вмикає лічильники
+    self.counters: comparisons (порівняння ключів) і swaps (переміщення елементів).
+    Елемент зберігається як [ключ, значення, індекс у масиві].
+    """
+
+    def __init__(self, iterable=None, kind="min", key=None, count=False):
+        if kind not in ("min", "max"):
+            raise ValueError("kind має бути 'min' або 'max'")
+        self.kind = kind
+        self.key = key
+        self.counters = {"comparisons": 0, "swaps": 0} if count else None
+        first = operator.lt if kind == "min" else operator.gt
+        if count:
+            counters = self.counters
+
+            def before(a, b):
+                counters["comparisons"] += 1
+                return first(a, b)
+
+            self._before = before
+        else:
+            self._before = first
+        self._heap = []
+        if iterable is not None:
+            self.heapify(iterable)
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __bool__(self):
+        return bool(self._heap)
+
+    def _entry(self, value):
+        return [self.key(value) if self.key else value, value, -1]
+
+    def _moved(self, n=1):
+        if self.counters is not None:
+            self.counters["swaps"] += n
+
+    def _sift_up(self, i):
+        heap, before = self._heap, self._before
+        entry = heap[i]
+        while i > 0:
+            p = (i - 1) >> 1
+            parent = heap[p]
+            if not before(entry[0], parent[0]):
+                break
+            heap[i] = parent
+            parent[2] = i
+            self._moved()
+            i = p
+        heap[i] = entry
+        entry[2] = i
+
+    def _sift_down(self, i):
+        heap, before = self._heap, self._before
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            c = 2 * i + 1
+            if c >= n:
+                break
+            if c + 1 < n and before(heap[c + 1][0], heap[c][0]):
+                c += 1
+            if not before(heap[c][0], entry[0]):
+                break
+            heap[i] = heap[c]
+            heap[i][2] = i
+            self._moved()
+            i = c
+        heap[i] = entry
+        entry[2] = i
+
+    def _push_entry(self, value):
+        entry = self._entry(value)
+        entry[2] = len(self._heap)
+        self._heap.append(entry)
+        self._sift_up(entry[2])
+        return entry
+
+    def push(self, value):
+        self._push_entry(value)
+
+    def peek(self):
+        if not self._heap:
+            raise IndexError("peek from empty heap")
+        return self._heap[0][1]
+
+    def pop(self):
+        heap = self._heap
+        if not heap:
+            raise IndexError("pop from empty heap")
+        top = heap[0]
+        last = heap.pop()
+        if heap:
+            heap[0] = last
+            self._sift_down(0)
+        top[2] = -1
+        return top[1]
+
+    def pushpop(self, value):
+        """push, а потім pop — за одне просіювання (як heapq.heappushpop)."""
+        entry = self._entry(value)
+        heap = self._heap
+        if heap and self._before(heap[0][0], entry[0]):
+            top = heap[0]
+            heap[0] = entry
+            self._sift_down(0)
+            top[2] = -1
+            return top[1]
+        return value
+
+    def replace(self, value):
+        """pop, а потім push — за одне просіювання (як heapq.heapreplace)."""
+        heap = self._heap
+        if not heap:
+            raise IndexError("replace on empty heap")
+        top = heap[0]
+        heap[0] = self._entry(value)
+        self._sift_down(0)
+        top[2] = -1
+        return top[1]
+
+    def heapify(self, iterable):
+        """Замінює вміст купи значеннями iterable за O(n)."""
+        heap = [self._entry(v) for v in iterable]
+        for i, entry in enumerate(heap):
+            entry[2] = i
+        self._heap = heap
+        for i in reversed(range(len(heap) // 2)):
+            self._sift_down(i)
+
+    def merge(self, other):
+        """
+        Додає m значень other (будь-якого iterable або Heap) до купи з n елементів.
+        Якщо m > n — повний heapify за O(n + m); інакше m просіювань угору,
+        O(m log(n + m)), що для малих m дешевше за перебудову всієї купи.
+        """
+        values = other.snapshot() if isinstance(other, Heap) else list(other)
+        heap = self._heap
+        start = len(heap)
+        for v in values:
+            entry = self._entry(v)
+            entry[2] = len(heap)
+            heap.append(entry)
+        if len(values) > start:
+            for i in reversed(range(len(heap) // 2)):
+                self._sift_down(i)
+        else:
+            for i in range(start, len(heap)):
+                self._sift_up(i)
+        return self
+
+    def snapshot(self):
+        """Значення в порядку масиву — напряму для draw_heap_array / visualize_heap."""
+        return [entry[1] for entry in self._heap]
+
+    def reset_counters(self):
+        if self.counters is not None:
+            self.counters.update(comparisons=0, swaps=0)
+
+
+class IndexedHeap(Heap):
+    """
+    Купа з дескрипторами: push повертає handle, через який можна змінити
+    ключ (decrease_key / update) або видалити елемент за O(log n).
+    """
+
+    def push(self, value):
+        return self._push_entry(value)
+
+    def value(self, handle):
+        self._check(handle)
+        return handle[1]
+
+    def _check(self, handle):
+        i = handle[2]
+        if i < 0 or i >= len(self._heap) or self._heap[i] is not handle:
+            raise KeyError("елемента вже немає в купі")
+        return i
+
+    def update(self, handle, value):
+        """Змінює значення елемента й відновлює порядок в обидва боки."""
+        i = self._check(handle)
+        handle[0] = self.key(value) if self.key else value
+        handle[1] = value
+        self._sift_up(i)
+        self._sift_down(handle[2])
+
+    def decrease_key(self, handle, value):
+        """Піднімає елемент ближче до вершини (для макс-купи — збільшує ключ)."""
+        i = self._check(handle)
+        new_key = self.key(value) if self.key else value
+        if self._before(handle[0], new_key):
+            raise ValueError("новий ключ гірший за поточний")
+        handle[0], handle[1] = new_key, value
+        self._sift_up(i)
+
+    def remove(self, handle):
+        i = self._check(handle)
+        heap = self._heap
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            last[2] = i
+            self._sift_up(i)
+            self._sift_down(last[2])
+        handle[2] = -1
+        return handle[1]
+
+
 # --------- НОВЕ: побудова дерева з купи (масиву) ---------
 def build_tree_from_heap_array(arr, highlight_index=None):
     """
@@ -73,37 +300,158 @@ def build_tree_from_heap_array(arr, highlight_index=None):
     return nodes[0]  # корінь
 
 
-def visualize_heap(values, heap_type="min", highlight_last=True, title=None):
+# --------- Масштабований шлях: координати прямо з індексів масиву ---------
+def heap_layout(n):
     """
-    values       — вихідні значення
-    heap_type    — 'min' або 'max'
-    highlight_last — виділити останній вставлений елемент
+    Координати вузлів купи з n елементів без побудови дерева:
+    рівень i — floor(log2(i + 1)), позиція на рівні p = i + 1 - 2**рівень,
+    x = (2p + 1) / 2**рівень - 1 (те саме розміщення, що дає add_edges), y = -рівень.
     """
-    data = list(values)
+    idx = np.arange(n)
+    level = np.floor(np.log2(idx + 1)).astype(np.int64)
+    # поправка на похибку log2 біля степенів двійки
+    level -= (1 << level) > idx + 1
+    level += (1 << (level + 1)) <= idx + 1
+    width = (1 << level).astype(float)
+    x = (2 * (idx + 1 - width) + 1) / width - 1
+    return x, -level.astype(float)
 
-    if heap_type == "min":
-        heap = data[:]
-        heapq.heapify(heap)          # стандартна мін-купа
-        title = title or "Мін-купа"
-        highlight_index = len(heap) - 1 if highlight_last and heap else None
 
-    elif heap_type == "max":
-        # перетворюємо у макс-купу через інверсію знаку
-        heap = [-x for x in data]
-        heapq.heapify(heap)
-        heap = [-x for x in heap]
-        title = title or "Макс-купа"
-        highlight_index = len(heap) - 1 if highlight_last and heap else None
+def draw_heap_array(arr, highlight_index=None, title=None, figsize=(12, 6),
+                    label_limit=255, path=None):
+    """
+    Малює купу-масив одним LineCollection для ребер і одним scatter для вузлів.
+    Підписи значень додаються лише для невеликих куп (n <= label_limit).
+    Якщо path задано — зберігає зображення у файл замість показу вікна.
+    """
+    n = len(arr)
+    if n == 0:
+        return
+    x, y = heap_layout(n)
+    child = np.arange(1, n)
+    parent = (child - 1) // 2
+    segments = np.stack((np.column_stack((x[parent], y[parent])),
+                         np.column_stack((x[child], y[child]))), axis=1)
+    fig, ax = plt.subplots(figsize=figsize)
+    if title:
+        ax.set_title(title)
+    ax.add_collection(LineCollection(segments, colors="gray", linewidths=0.5))
+    size = min(600.0, max(2.0, 2500 / n ** 0.5))  # менші точки для більших куп
+    ax.scatter(x, y, s=size, c="skyblue", zorder=2)
+    if highlight_index is not None:
+        ax.scatter(x[highlight_index], y[highlight_index], s=size, c="tomato", zorder=2)
+    if n <= label_limit:
+        for xi, yi, v in zip(x, y, arr):
+            ax.text(xi, yi, str(v), ha="center", va="center", fontsize=8, zorder=3)
+    ax.set_xlim(-1.05, 1.05)
+    ax.set_ylim(y.min() - 0.5, 0.5)
+    ax.axis("off")
+    if path:
+        fig.savefig(path)
+        plt.close(fig)
+    else:
+        plt.show()
+
 
+def visualize_heap(values, heap_type="min", highlight_last=True, title=None, fast=None, path=None,
+                   key=None):
+    """
+    values       — вихідні значення або готовий Heap (малюється його знімок)
+    heap_type    — 'min' або 'max'
+    highlight_last — виділити останній вставлений елемент
+    fast         — True: draw_heap_array; False: networkx; None: за розміром (NX_LIMIT)
+    path         — файл для швидкого шляху замість вікна
+    key          — функція ключа (значення можуть бути не числами)
+    """
+    if isinstance(values, Heap):
+        heap_type = values.kind
+        heap = values.snapshot()
+    elif heap_type in ("min", "max"):
+        heap = Heap(values, kind=heap_type, key=key).snapshot()
     else:
         raise ValueError("heap_type має бути 'min' або 'max'")
+    title = title or ("Мін-купа" if heap_type == "min" else "Макс-купа")
+    highlight_index = len(heap) - 1 if highlight_last and heap else None
 
+    if fast is None:
+        fast = len(heap) > NX_LIMIT
+    if fast:
+        draw_heap_array(heap, highlight_index=highlight_index, title=title, path=path)
+        return
     root = build_tree_from_heap_array(heap, highlight_index=highlight_index)
     draw_tree(root, title=title)
 
 
+def benchmark(sizes=(1_000, 10_000, 100_000), path="heap_bench.png"):
+    """Час розміщення й рендеру у файл швидким шляхом."""
+    rng = np.random.default_rng(0)
+    print(f"{'n':>8} | {'heap_layout':>11} | {'рендер у PNG':>12}")
+    for n in sizes:
+        heap = rng.integers(0, 10**6, n).tolist()
+        heapq.heapify(heap)
+        t0 = time.perf_counter()
+        heap_layout(n)
+        t_layout = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        draw_heap_array(heap, highlight_index=n - 1, path=path)
+        t_draw = time.perf_counter() - t0
+        print(f"{n:>8} | {t_layout:>10.4f}s | {t_draw:>11.3f}s")
+
+
+def benchmark_ops(n=100_000, seed=0):
+    """push + pop n елементів: heapq (max через інверсію знаку) vs Heap."""
+    rng = random.Random(seed)
+    data = [rng.randint(0, 10**9) for _ in range(n)]
+
+    def heapq_min():
+        h = []
+        for x in data:
+            heapq.heappush(h, x)
+        while h:
+            heapq.heappop(h)
+
+    def heapq_max():
+        h = []
+        for x in data:
+            heapq.heappush(h, -x)
+        while h:
+            -heapq.heappop(h)
+
+    def ours(kind, count=False):
+        def run():
+            h = Heap(kind=kind, count=count)
+            for x in data:
+                h.push(x)
+            while h:
+                h.pop()
+            return h
+        return run
+
+    print(f"n = {n}")
+    print(f"{'варіант':<24} | {'час':>8}")
+    for name, fn in (("heapq (min)", heapq_min), ("heapq (max, -x)", heapq_max),
+                     ("Heap (min)", ours("min")), ("Heap (max)", ours("max")),
+                     ("Heap (max, лічильники)", ours("max", count=True))):
+        t0 = time.perf_counter()
+        res = fn()
+        print(f"{name:<24} | {time.perf_counter() - t0:>7.3f}s")
+    print("лічильники:", res.counters)
+
+
 # ------------------ приклади запуску ------------------
 if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Візуалізація купи.")
+    ap.add_argument("--bench", choices=["draw", "ops"],
+                    help="draw — рендер великих куп; ops — операції Heap проти heapq")
+    bench = ap.parse_args().bench
+    if bench == "draw":
+        plt.switch_backend("Agg")
+        benchmark()
+        raise SystemExit
+    if bench == "ops":
+        benchmark_ops()
+        raise SystemExit
+
     values = [10, 4, 7, 15, 3, 20, 9, 1]
 
     # Візуалізація мін-купи
@@ -3,19 +3,26 @@
 
 Використовується той самий клас Node, що й у завданні 4.
 
-Для обходу в DFS використовується стек (list.append, pop).
+Обходи беруться зі спільного модуля tree_traversal: DFS — прямий обхід
+(preorder, стек), BFS — обхід за рівнями (level_order, черга).
 
-Для обходу в BFS використовується черга (collections.deque).
+dfs_steps/bfs_steps — генератори подій (крок, вузол); відвідані вузли
+зберігаються у множині, тож спільний вузол показується лише раз.
 
-Після кожного відвідування вузол перефарбовується, і викликається функція візуалізації.
+Розміщення дерева обчислюється один раз, а кожен кадр анімації лише
+перефарбовує вузли (GIF/MP4 або одне зображення з панелями).
 
 Кольори плавно змінюються (градієнт).
 """
 
+import argparse
 import networkx as nx
 import matplotlib.pyplot as plt
+from matplotlib import animation
+from matplotlib.colors import to_rgba
 import uuid
-from collections import deque
+
+from tree_traversal import level_order, preorder
 
 
 class Node:
@@ -28,18 +35,18 @@ class Node:
 
 
 def add_edges(graph, node, pos, x=0, y=0, layer=1):
-    if node is not None:
+    # прямий обхід з tree_traversal (без рекурсії): батько йде раніше за дітей,
+    # тож його координати вже відомі
+    place = {node.id: (x, y, layer)} if node is not None else {}
+    for node in preorder(node):
+        x, y, layer = place.pop(node.id)
         graph.add_node(node.id, color=node.color, label=node.val)
-        if node.left:
-            graph.add_edge(node.id, node.left.id)
-            l = x - 1 / 2 ** layer
-            pos[node.left.id] = (l, y - 1)
-            add_edges(graph, node.left, pos, x=l, y=y - 1, layer=layer + 1)
-        if node.right:
-            graph.add_edge(node.id, node.right.id)
-            r = x + 1 / 2 ** layer
-            pos[node.right.id] = (r, y - 1)
-            add_edges(graph, node.right, pos, x=r, y=y - 1, layer=layer + 1)
+        for child, side in ((node.right, 1), (node.left, -1)):
+            if child:
+                graph.add_edge(node.id, child.id)
+                cx = x + side / 2 ** layer
+                pos[child.id] = (cx, y - 1)
+                place[child.id] = (cx, y - 1, layer + 1)
     return graph
 
 
@@ -62,56 +69,138 @@ def get_color(step, total):
     return f"#{intensity:02x}{(100+step*5)%255:02x}{(200-step*3)%255:02x}"
 
 
-# DFS (ітеративно, стек)
-def dfs(root):
-    stack = [root]
-    visited = []
-    step = 0
-    while stack:
-        node = stack.pop()
-        if node not in visited:
-            visited.append(node)
-            node.color = get_color(step, 10)
-            step += 1
-            draw_tree(root)
-            if node.right:
-                stack.append(node.right)
-            if node.left:
-                stack.append(node.left)
-
-
-# BFS (ітеративно, черга)
-def bfs(root):
-    queue = deque([root])
-    visited = []
+def _visit_steps(nodes):
+    """Події (крок, вузол); вузол, уже наявний у множині visited, пропускається."""
+    visited = set()
     step = 0
-    while queue:
-        node = queue.popleft()
-        if node not in visited:
-            visited.append(node)
-            node.color = get_color(step, 10)
-            step += 1
-            draw_tree(root)
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-
-
-# Приклад дерева
-root = Node(0)
-root.left = Node(4)
-root.right = Node(1)
-root.left.left = Node(5)
-root.left.right = Node(10)
-root.right.left = Node(3)
-
-print("DFS:")
-dfs(root)
-
-# скидаємо кольори перед BFS
-for node in [root, root.left, root.right, root.left.left, root.left.right, root.right.left]:
-    node.color = "#000000"
-
-print("BFS:")
-bfs(root)
+    for node in nodes:
+        if node.id in visited:
+            continue
+        visited.add(node.id)
+        yield step, node
+        step += 1
+
+
+# DFS (прямий обхід, стек): події (крок, вузол)
+def dfs_steps(root):
+    return _visit_steps(preorder(root))
+
+
+# BFS (за рівнями, черга): події (крок, вузол)
+def bfs_steps(root):
+    return _visit_steps(level_order(root))
+
+
+def render_traversal(root, events, title=None, path=None, fps=2, node_size=2000):
+    """
+    Малює обхід: розміщення й граф будуються один раз, кадр k лише змінює
+    колір вузла з події k. path:
+      - None          — показати анімацію у вікні;
+      - *.gif / *.mp4 — зберегти анімацію (Pillow / ffmpeg);
+      - інше (*.png)  — одне зображення з панеллю на кожен крок.
+    Повертає список подій (крок, вузол).
+    """
+    tree = nx.DiGraph()
+    pos = {root.id: (0, 0)}
+    tree = add_edges(tree, root, pos)
+    order = list(tree.nodes)
+    index = {nid: i for i, nid in enumerate(order)}
+    labels = {nid: data["label"] for nid, data in tree.nodes(data=True)}
+    base = [tree.nodes[nid]["color"] for nid in order]
+
+    events = list(events)
+    total = max(len(events), 1)
+    changes = []
+    for step, node in events:
+        node.color = get_color(step, total)  # як і раніше, вузол запам'ятовує свій колір
+        changes.append((index[node.id], node.color))
+
+    if path is not None and not path.lower().endswith((".gif", ".mp4")):
+        cols = min(len(changes), 4) or 1
+        rows = (len(changes) + cols - 1) // cols or 1
+        fig, axes = plt.subplots(rows, cols, figsize=(4 * cols, 3 * rows), squeeze=False)
+        colors = list(base)
+        for k, ax in enumerate(axes.flat):
+            ax.axis("off")
+            if k >= len(changes):
+                continue
+            i, color = changes[k]
+            colors[i] = color
+            ax.set_title(f"крок {k + 1}: {labels[order[i]]}")
+            nx.draw(tree, pos=pos, ax=ax, nodelist=order, labels=labels, arrows=False,
+                    node_size=node_size // 4, node_color=list(colors), font_size=8)
+        if title:
+            fig.suptitle(title)
+        fig.savefig(path)
+        plt.close(fig)
+        return events
+
+    fig, ax = plt.subplots(figsize=(8, 5))
+    ax.axis("off")
+    if title:
+        ax.set_title(title)
+    nx.draw_networkx_edges(tree, pos=pos, ax=ax, arrows=False)
+    nodes = nx.draw_networkx_nodes(tree, pos=pos, ax=ax, nodelist=order,
+                                   node_size=node_size, node_color=base)
+    nx.draw_networkx_labels(tree, pos=pos, ax=ax, labels=labels)
+    face = [to_rgba(c) for c in base]
+
+    def update(k):
+        i, color = changes[k]
+        face[i] = to_rgba(color)
+        nodes.set_facecolor(face)
+        return (nodes,)
+
+    anim = animation.FuncAnimation(fig, update, frames=len(changes),
+                                   interval=1000 // fps, repeat=False)
+    if path is None:
+        plt.show()
+    else:
+        writer = animation.PillowWriter(fps=fps) if path.lower().endswith(".gif") \
+            else animation.FFMpegWriter(fps=fps)
+        anim.save(path, writer=writer)
+        plt.close(fig)
+    return events
+
+
+# DFS з анімацією
+def dfs(root, path=None):
+    return render_traversal(root, dfs_steps(root), title="DFS", path=path)
+
+
+# BFS з анімацією
+def bfs(root, path=None):
+    return render_traversal(root, bfs_steps(root), title="BFS", path=path)
+
+
+def build_example():
+    root = Node(0)
+    root.left = Node(4)
+    root.right = Node(1)
+    root.left.left = Node(5)
+    root.left.right = Node(10)
+    root.right.left = Node(3)
+    return root
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Анімація обходів DFS/BFS.")
+    ap.add_argument("--out", help="Префікс файлів: <out>_dfs.gif тощо (без вікна)")
+    ap.add_argument("--format", choices=["gif", "mp4", "png"], default="gif",
+                    help="gif/mp4 — анімація, png — одне зображення з панелями")
+    args = ap.parse_args()
+    if args.out:
+        plt.switch_backend("Agg")
+
+    def target(name):
+        return f"{args.out}_{name}.{args.format}" if args.out else None
+
+    # Приклад дерева
+    root = build_example()
+    print("DFS:")
+    dfs(root, path=target("dfs"))
+
+    # нове дерево з чорними вузлами перед BFS
+    root = build_example()
+    print("BFS:")
+    bfs(root, path=target("bfs"))
@@ -1,3 +1,14 @@
+import argparse
+import bisect
+import hashlib
+import math
+import random
+import time
+import tracemalloc
+from collections import OrderedDict
+
+import numpy as np
+
 items = {
     "pizza": {"cost": 50, "calories": 300},
     "hamburger": {"cost": 40, "calories": 250},
@@ -54,7 +65,490 @@ def dynamic_programming(items, budget):
     return chosen_items, dp[n][budget]
 
 
-# 🔹 Тест
-budget = 100
-print("Greedy:", greedy_algorithm(items, budget))
-print("Dynamic Programming:", dynamic_programming(items, budget))
+# Динамічне програмування з пам'яттю O(budget) на рядок (NumPy)
+def _value_dtype(calories):
+    # явно int64/float64: у NumPy 1.x np.result_type для Python int бере найменший
+    # тип, що вміщує значення (int16 для демо-меню), і рядок DP переповнюється
+    return np.float64 if any(isinstance(c, float) for c in calories) else np.int64
+
+
+def _dp_row_step(row, cost, calories):
+    """
+    Один предмет: новий рядок DP і рішення take[b] ("брати предмет при бюджеті b").
+    Брати — лише якщо це строго краще, як у max(...) з dynamic_programming,
+    тому відновлення дає ті самі страви.
+    """
+    cand = row[:len(row) - cost] + calories
+    take = np.zeros(len(row), dtype=bool)
+    take[cost:] = cand > row[cost:]
+    new = row.copy()
+    np.copyto(new[cost:], cand, where=take[cost:])
+    return new, take
+
+
+def dynamic_programming_np(items, budget, block=None):
+    """
+    Те саме, що dynamic_programming (страви й калорії збігаються точно), але:
+    - таблиця не зберігається: один рядок DP, оновлення — векторно на предмет;
+    - для відновлення лишаються лише біти рішень (np.packbits, 1 біт на клітинку).
+    block — скільки предметів тримати в бітах одночасно. За замовчуванням усі
+    (один прохід, n * (budget + 1) / 8 байтів). Менший block зберігає лише рядки DP
+    на межах блоків і перераховує біти блоку під час відновлення: пам'ять
+    ~ (n / block) рядків + block бітових рядків ціною другого проходу.
+    block="auto" — 8 * sqrt(n), де ці дві частини приблизно рівні для int64.
+    """
+    names = list(items.keys())
+    n = len(names)
+    costs = [items[name]["cost"] for name in names]
+    calories = [items[name]["calories"] for name in names]
+    dtype = _value_dtype(calories)
+    if block == "auto":
+        block = int(8 * math.sqrt(n))
+    block = max(n if not block or block >= n else block, 1)
+
+    def run(row, start, end, keep_bits):
+        bits = []
+        for i in range(start, end):
+            if costs[i] > budget:
+                bits.append(None)  # предмет не влазить у жоден бюджет: рядок не змінюється
+                continue
+            row, take = _dp_row_step(row, costs[i], calories[i])
+            bits.append(np.packbits(take) if keep_bits else None)
+        return row, bits
+
+    # прямий прохід: або всі біти одразу, або лише рядки на межах блоків
+    row = np.zeros(budget + 1, dtype=dtype)
+    checkpoints = []
+    bits = None
+    for start in range(0, max(n, 1), block):
+        checkpoints.append(row)
+        row, bits = run(row, start, min(start + block, n), keep_bits=block == n)
+    best = row[budget].item()
+
+    chosen_items = []
+    b = budget
+    for k in range(len(checkpoints) - 1, -1, -1):
+        start, end = k * block, min((k + 1) * block, n)
+        if block < n:
+            # перераховуємо біти лише цього блоку від збереженого рядка
+            _, bits = run(checkpoints[k], start, end, keep_bits=True)
+        for i in range(end - 1, start - 1, -1):
+            packed = bits[i - start]
+            if packed is not None and packed[b >> 3] >> (7 - (b & 7)) & 1:
+                chosen_items.append(names[i])
+                b -= costs[i]
+
+    return chosen_items, best
+
+
+# Багато бюджетів з одного проходу DP
+class KnapsackTable:
+    """
+    Один прохід DP до max_budget (як у dynamic_programming_np): останній рядок
+    дає калорії для кожного бюджету b <= max_budget, а біти рішень — страви.
+    Значення dp[i][b] не залежать від max_budget, тому query(b) повертає
+    те саме, що dynamic_programming(items, b). Пам'ять — n * (max_budget + 1) / 8 байтів.
+    """
+
+    def __init__(self, items, max_budget):
+        self.names = list(items.keys())
+        self.costs = [items[name]["cost"] for name in self.names]
+        calories = [items[name]["calories"] for name in self.names]
+        self.max_budget = max_budget
+        row = np.zeros(max_budget + 1, dtype=_value_dtype(calories))
+        self._bits = []
+        for cost, cal in zip(self.costs, calories):
+            if cost > max_budget:
+                self._bits.append(None)
+                continue
+            row, take = _dp_row_step(row, cost, cal)
+            self._bits.append(np.packbits(take))
+        self.values = row
+
+    def _check(self, budget):
+        # від'ємний індекс NumPy мовчки повернув би відповідь для найбільшого бюджету
+        if not 0 <= budget <= self.max_budget:
+            raise ValueError(f"бюджет має бути в межах 0..{self.max_budget}")
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + sum(bits.nbytes for bits in self._bits if bits is not None)
+
+    def value(self, budget):
+        """Максимум калорій для бюджету за O(1)."""
+        self._check(budget)
+        return self.values[budget].item()
+
+    def query(self, budget):
+        """(chosen_items, total_calories) для бюджету за O(n)."""
+        self._check(budget)
+        chosen_items = []
+        b = budget
+        for i in range(len(self.names) - 1, -1, -1):
+            packed = self._bits[i]
+            if packed is not None and packed[b >> 3] >> (7 - (b & 7)) & 1:
+                chosen_items.append(self.names[i])
+                b -= self.costs[i]
+        return chosen_items, self.value(budget)
+
+    def query_many(self, budgets):
+        return [self.query(b) for b in budgets]
+
+
+def menu_key(items):
+    """Хеш меню: назви, ціни й калорії в порядку страв (порядок впливає на вибір за рівних сум)."""
+    h = hashlib.blake2b(digest_size=16)
+    for name, data in items.items():
+        h.update(repr((name, data["cost"], data["calories"])).encode())
+    return h.hexdigest()
+
+
+class KnapsackCache:
+    """
+    LRU-кеш таблиць KnapsackTable за menu_key: не більше maxsize таблиць і
+    max_bytes байтів сумарно (таблиця займає ~ n * (max_budget + 1) / 8 байтів
+    плюс рядок значень). Таблиця, більша за max_bytes, не кешується.
+    Таблиця з більшим max_budget обслуговує й менші бюджети; якщо потрібен
+    більший, таблиця для цього меню перебудовується.
+    Лічильники: hits, misses.
+    """
+
+    def __init__(self, maxsize=8, max_bytes=64 * 2**20):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self._tables = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, items, max_budget):
+        key = menu_key(items)
+        table = self._tables.get(key)
+        if table is not None and table.max_budget >= max_budget:
+            self.hits += 1
+            self._tables.move_to_end(key)
+            return table
+        self.misses += 1
+        if table is not None:
+            self.nbytes -= self._tables.pop(key).nbytes
+        table = KnapsackTable(items, max_budget)
+        if table.nbytes > self.max_bytes:
+            return table
+        self._tables[key] = table
+        self.nbytes += table.nbytes
+        while len(self._tables) > self.maxsize or self.nbytes > self.max_bytes:
+            self.nbytes -= self._tables.popitem(last=False)[1].nbytes
+        return table
+
+    def clear(self):
+        self._tables.clear()
+        self.nbytes = 0
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._tables), "bytes": self.nbytes}
+
+
+def dynamic_programming_many(items, budgets, cache=None):
+    """
+    Відповіді dynamic_programming(items, b) для кожного b з budgets з одного
+    проходу DP до max(budgets). Кеш вмикається явно: передайте KnapsackCache,
+    і повторне меню береться з нього.
+    """
+    budgets = list(budgets)
+    if not budgets:
+        return []
+    top = max(budgets)
+    table = cache.get(items, top) if cache is not None else KnapsackTable(items, top)
+    return table.query_many(budgets)
+
+
+# Розв'язувачі, що не залежать від розміру бюджету
+def _ratio(data):
+    # той самий ключ, що й у greedy_algorithm; безкоштовні страви — першими
+    return data["calories"] / data["cost"] if data["cost"] else math.inf
+
+
+def branch_and_bound(items, budget, stats=None, max_nodes=None):
+    """
+    Точний розв'язок гілками й межами. Страви впорядковані за калоріями на
+    одиницю вартості (як у greedy_algorithm), верхня межа вузла — дробова
+    релаксація: беремо страви по черзі, останню — частково. Префіксні суми +
+    bisect дають межу за O(log n). Стартовий рекорд — жадібний розв'язок.
+    Обхід у глибину через стек, спершу гілка "брати".
+    Якщо передано stats, у stats["nodes"] записується кількість вузлів;
+    max_nodes обриває пошук (результат тоді — найкращий знайдений, stats["exact"] = False).
+    Калорії збігаються з dynamic_programming; за рівних сум набір страв може відрізнятися.
+    """
+    order = sorted((name for name in items if items[name]["cost"] <= budget),
+                   key=lambda name: _ratio(items[name]), reverse=True)
+    costs = [items[name]["cost"] for name in order]
+    cals = [items[name]["calories"] for name in order]
+    n = len(order)
+    pre_cost, pre_cal = [0], [0]
+    for c, v in zip(costs, cals):
+        pre_cost.append(pre_cost[-1] + c)
+        pre_cal.append(pre_cal[-1] + v)
+
+    def bound(i, cap):
+        # скільки страв i..j-1 влазять повністю
+        j = bisect.bisect_right(pre_cost, pre_cost[i] + cap, i) - 1
+        extra = pre_cal[j] - pre_cal[i]
+        if j < n:
+            extra += cals[j] * (cap - (pre_cost[j] - pre_cost[i])) / costs[j]
+        return extra
+
+    # жадібний рекорд у тому ж порядку
+    best, best_chain, cap = 0, None, budget
+    for i in range(n):
+        if costs[i] <= cap:
+            cap -= costs[i]
+            best += cals[i]
+            best_chain = (i, best_chain)
+
+    nodes = 0
+    exact = True
+    stack = [(0, budget, 0, None)]
+    while stack:
+        i, cap, value, chain = stack.pop()
+        nodes += 1
+        if value > best:
+            best, best_chain = value, chain
+        if i == n or value + bound(i, cap) <= best:
+            continue
+        if max_nodes is not None and nodes >= max_nodes:
+            exact = False
+            break
+        stack.append((i + 1, cap, value, chain))
+        if costs[i] <= cap:
+            stack.append((i + 1, cap - costs[i], value + cals[i], (i, chain)))
+
+    if stats is not None:
+        stats["nodes"] = nodes
+        stats["exact"] = exact
+    chosen_items = []
+    while best_chain is not None:
+        i, best_chain = best_chain
+        chosen_items.append(order[i])
+    chosen_items.reverse()
+    return chosen_items, best
+
+
+def _subset_sums(costs, cals):
+    """Вартість і калорії всіх 2**k підмножин; біт j індексу — чи взято страву j."""
+    c = np.zeros(1, dtype=np.int64)
+    v = np.zeros(1, dtype=_value_dtype(cals))
+    for cost, cal in zip(costs, cals):
+        c = np.concatenate((c, c + cost))
+        v = np.concatenate((v, v + cal))
+    return c, v
+
+
+def meet_in_the_middle(items, budget):
+    """
+    Точний розв'язок для n <= ~40 за O(2**(n/2) * n) незалежно від бюджету.
+    Страви ділимо навпіл; підмножини другої половини сортуються за вартістю
+    з префіксним максимумом калорій, тож для кожної підмножини першої половини
+    найкраще доповнення знаходиться бінарним пошуком (усе векторно, NumPy).
+    Калорії збігаються з dynamic_programming; за рівних сум набір страв може відрізнятися.
+    """
+    names = [name for name in items if items[name]["cost"] <= budget]
+    if len(names) > 44:
+        raise ValueError("meet_in_the_middle розрахований на n <= ~40 страв")
+    half = len(names) // 2
+    first, second = names[:half], names[half:]
+    c1, v1 = _subset_sums([items[x]["cost"] for x in first], [items[x]["calories"] for x in first])
+    c2, v2 = _subset_sums([items[x]["cost"] for x in second], [items[x]["calories"] for x in second])
+
+    order = np.argsort(c2, kind="stable")
+    c2, v2 = c2[order], v2[order]
+    run_max = np.maximum.accumulate(v2)
+    # індекс підмножини, що дає префіксний максимум
+    best_at = np.maximum.accumulate(np.where(v2 == run_max, np.arange(len(v2)), 0))
+
+    fits = c1 <= budget
+    pos = np.searchsorted(c2, budget - c1[fits], side="right") - 1   # pos >= 0: порожня підмножина
+    totals = v1[fits] + run_max[pos]
+    k = int(np.argmax(totals))
+    mask1 = int(np.flatnonzero(fits)[k])
+    mask2 = int(order[best_at[pos[k]]])
+
+    chosen_items = [x for j, x in enumerate(first) if mask1 >> j & 1]
+    chosen_items += [x for j, x in enumerate(second) if mask2 >> j & 1]
+    return chosen_items, totals[k].item()
+
+
+DP_CELLS_LIMIT = 50_000_000   # n * (budget + 1), до якого DP швидше за перебір
+MITM_LIMIT = 40
+
+
+def choose_method(items, budget, exact=True):
+    """
+    Вибір для method="auto": DP, якщо таблиця невелика (n * budget <= DP_CELLS_LIMIT);
+    інакше meet-in-the-middle для n <= MITM_LIMIT; інакше гілки й межі,
+    а з exact=False — жадібний алгоритм.
+    """
+    n = sum(1 for data in items.values() if data["cost"] <= budget)
+    if n * (budget + 1) <= DP_CELLS_LIMIT:
+        return "dp"
+    if n <= MITM_LIMIT:
+        return "mitm"
+    return "bnb" if exact else "greedy"
+
+
+def solve(items, budget, method="auto", exact=True, stats=None):
+    """
+    Єдина точка входу: method — "greedy", "dp", "bnb", "mitm" або "auto"
+    (див. choose_method). Явно обрані з exact=False гілки й межі обмежуються
+    мільйоном вузлів. Обраний метод записується в stats["method"].
+    Гілки й межі точні, але на сильно скорельованих меню (калорії ~ ціна)
+    можуть перебирати експоненційно багато вузлів.
+    """
+    if method == "auto":
+        method = choose_method(items, budget, exact)
+    if stats is not None:
+        stats["method"] = method
+    if method == "greedy":
+        return greedy_algorithm(items, budget)
+    if method == "dp":
+        return dynamic_programming_np(items, budget, block="auto")
+    if method == "mitm":
+        return meet_in_the_middle(items, budget)
+    if method == "bnb":
+        return branch_and_bound(items, budget, stats, max_nodes=None if exact else 1_000_000)
+    raise ValueError(f"Невідомий метод: {method}")
+
+
+def random_menu(n, max_cost=100, max_calories=1000, seed=0, kind="uncorrelated"):
+    """
+    Синтетичне меню з n стравами (для бенчмарків). kind: "uncorrelated" —
+    калорії не залежать від ціни; "weak" — калорії ~ ціна ± 10%;
+    "strong" — калорії = ціна + const (найважче для гілок і меж).
+    """
+    rng = random.Random(seed)
+    menu = {}
+    for i in range(n):
+        cost = rng.randint(1, max_cost)
+        if kind == "uncorrelated":
+            cal = rng.randint(1, max_calories)
+        elif kind == "weak":
+            cal = max(1, cost * max_calories // max_cost + rng.randint(-max_calories // 10, max_calories // 10))
+        else:
+            cal = cost * max_calories // max_cost + max_calories // 10
+        menu[f"dish-{i}"] = {"cost": cost, "calories": cal}
+    return menu
+
+
+def _measure(fn):
+    """(результат, час, пік пам'яті в МБ); час — окремим запуском, без tracemalloc."""
+    t0 = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - t0
+    tracemalloc.start()
+    fn()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def benchmark(cases=((200, 10_000), (1_000, 50_000), (2_000, 1_000_000))):
+    print(f"{'n':>6} | {'budget':>9} | {'dynamic_programming':>21} | {'NumPy, біти':>19} | {'NumPy, block=auto':>19}")
+    for n, budget in cases:
+        menu = random_menu(n, max_cost=budget // 10, seed=n)
+        if n * budget <= 2_000_000:
+            ref, t_ref, m_ref = _measure(lambda: dynamic_programming(menu, budget))
+            ref_col = f"{t_ref:>7.2f}s {m_ref:>8.1f} МБ"
+        else:
+            ref, ref_col = None, "пропущено"
+        cols = []
+        for block in (None, "auto"):
+            if block is None and n * budget > 500_000_000:
+                cols.append("пропущено")
+                continue
+            res, t, m = _measure(lambda: dynamic_programming_np(menu, budget, block=block))
+            assert ref is None or res == ref
+            cols.append(f"{t:>7.2f}s {m:>8.1f} МБ")
+        print(f"{n:>6} | {budget:>9} | {ref_col:>21} | {cols[0]:>19} | {cols[1]:>19}")
+
+
+def benchmark_solvers(node_limit=2_000_000):
+    """
+    Синтетичні меню з цінами "в копійках" (великий бюджет = половина суми цін):
+    час кожного розв'язувача й відставання жадібного від оптимуму.
+    Гілки й межі обриваються після node_limit вузлів (позначка "+"): тоді
+    відставання жадібного рахується від найкращого знайденого.
+    """
+    cases = [(20, 1_000), (30, 100_000), (40, 100_000), (200, 100_000), (2_000, 100_000)]
+    print(f"{'меню':<13} | {'n':>5} | {'budget':>10} | {'greedy':>14} | {'dp':>8} | {'mitm':>8} | {'bnb':>20} | auto")
+    for kind in ("uncorrelated", "weak", "strong"):
+        for n, max_cost in cases:
+            menu = random_menu(n, max_cost=max_cost, max_calories=max_cost, seed=n, kind=kind)
+            budget = sum(d["cost"] for d in menu.values()) // 2
+            cols = {}
+            values = {}
+            for method in ("greedy", "dp", "mitm", "bnb"):
+                if method == "dp" and n * (budget + 1) > DP_CELLS_LIMIT:
+                    cols[method] = "—"
+                    continue
+                if method == "mitm" and n > MITM_LIMIT:
+                    cols[method] = "—"
+                    continue
+                stats = {}
+                t0 = time.perf_counter()
+                if method == "bnb":
+                    _, value = branch_and_bound(menu, budget, stats, max_nodes=node_limit)
+                else:
+                    _, value = solve(menu, budget, method=method)
+                elapsed = time.perf_counter() - t0
+                values[method] = value
+                cols[method] = f"{elapsed:.3f}s"
+                if method == "bnb":
+                    cols[method] += f" {stats['nodes']:>9}" + ("" if stats["exact"] else "+")
+            exact = [values[m] for m in ("dp", "mitm", "bnb") if m in values]
+            opt = max(exact)
+            assert all(v == opt for m, v in values.items() if m in ("dp", "mitm"))
+            gap = 100 * (opt - values["greedy"]) / opt if opt else 0.0
+            cols["greedy"] += f" {gap:>5.2f}%"
+            print(f"{kind:<13} | {n:>5} | {budget:>10} | {cols['greedy']:>14} | {cols['dp']:>8} | "
+                  f"{cols['mitm']:>8} | {cols['bnb']:>20} | {choose_method(menu, budget)}")
+
+
+def benchmark_batch(n=300, max_budget=20_000, queries=200):
+    """Сотні бюджетів на запит: окремі виклики DP проти однієї таблиці та кешу."""
+    menu = random_menu(n, max_cost=max_budget // 20, seed=7)
+    budgets = random.Random(7).sample(range(max_budget + 1), queries)
+    t0 = time.perf_counter()
+    single = [dynamic_programming_np(menu, b) for b in budgets]
+    t_single = time.perf_counter() - t0
+    cache = KnapsackCache()
+    t0 = time.perf_counter()
+    batch = dynamic_programming_many(menu, budgets, cache)
+    t_batch = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    again = dynamic_programming_many(menu, budgets, cache)
+    t_cached = time.perf_counter() - t0
+    assert single == batch == again
+    print(f"n = {n}, {queries} бюджетів до {max_budget}")
+    print(f"dynamic_programming_np по одному: {t_single:.3f}s")
+    print(f"dynamic_programming_many:         {t_batch:.3f}s")
+    print(f"повторне меню (кеш):              {t_cached:.4f}s  {cache.stats()}")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Вибір їжі: жадібний алгоритм і динамічне програмування.")
+    ap.add_argument("--budget", type=int, default=100, help="Бюджет")
+    ap.add_argument("--bench", choices=["dp", "solvers", "batch"],
+                    help="dp — DP-реалізації за часом і пам'яттю; solvers — усі розв'язувачі "
+                         "на синтетичних меню; batch — багато бюджетів з однієї таблиці")
+    args = ap.parse_args()
+    if args.bench == "dp":
+        benchmark()
+    elif args.bench == "solvers":
+        benchmark_solvers()
+    elif args.bench == "batch":
+        benchmark_batch()
+    else:
+        print("Greedy:", greedy_algorithm(items, args.budget))
+        print("Dynamic Programming:", dynamic_programming(items, args.budget))
+        print("Dynamic Programming (NumPy):", dynamic_programming_np(items, args.budget))
+        print("Branch and bound:", branch_and_bound(items, args.budget))
+        print("Meet in the middle:", meet_in_the_middle(items, args.budget))
@@ -1,7 +1,18 @@
+import argparse
+import math
+import os
 import random
+import time
+from statistics import NormalDist
+from concurrent.futures import ProcessPoolExecutor
+
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+TASK_TRIALS = 1 << 22   # кидків на одне завдання пулу; фіксоване, щоб результат не залежав від workers
+CHUNK = 1 << 20         # кидків в одному масиві NumPy
+
 def monte_carlo_dice(n_trials=1000000):
     # Лічильник сум
     sums = {i: 0 for i in range(2, 13)}
@@ -13,34 +24,285 @@ def monte_carlo_dice(n_trials=1000000):
     probabilities = {s: (count / n_trials) for s, count in sums.items()}
     return probabilities
 
-def main():
-    # Симуляція
-    trials = 200000
-    probs = monte_carlo_dice(trials)
+def _draw_dtype(sides):
+    return np.uint8 if sides < 256 else np.int32
 
-    # Аналітичні результати
-    analytical = {
-        2: 1/36, 3: 2/36, 4: 3/36, 5: 4/36, 6: 5/36,
-        7: 6/36, 8: 5/36, 9: 4/36, 10: 3/36, 11: 2/36, 12: 1/36
+
+def _count_task(args):
+    """Лічильники сум для одного завдання зі своїм незалежним потоком випадкових чисел."""
+    seed_seq, trials, dice, sides, chunk = args
+    rng = np.random.default_rng(seed_seq)
+    counts = np.zeros(dice * sides + 1, dtype=np.int64)
+    dtype = _draw_dtype(sides)
+    while trials > 0:
+        m = min(chunk, trials)
+        rolls = rng.integers(1, sides + 1, size=(m, dice), dtype=dtype)
+        counts += np.bincount(rolls.sum(axis=1, dtype=np.int32), minlength=len(counts))
+        trials -= m
+    return counts
+
+
+def dice_counts(n_trials, dice=2, sides=6, seed=None, workers=1, chunk=CHUNK):
+    """
+    Скільки разів випала кожна сума (масив, індекс — сума) для n_trials кидків
+    dice кубиків з sides гранями. Кидки генеруються блоками по chunk і
+    рахуються через bincount, тож пам'ять — O(chunk * dice) за будь-якого n_trials.
+    Кидки діляться на завдання по TASK_TRIALS, кожне зі своїм потоком з
+    SeedSequence(seed).spawn: за однакового seed результат однаковий і для
+    workers=1, і для пулу процесів з будь-якою кількістю workers.
+    """
+    if n_trials < 0 or dice < 1 or sides < 1:
+        raise ValueError("потрібні n_trials >= 0, dice >= 1, sides >= 1")
+    n_tasks = max(1, -(-n_trials // TASK_TRIALS))
+    children = np.random.SeedSequence(seed).spawn(n_tasks)
+    tasks = [(ss, min(TASK_TRIALS, n_trials - i * TASK_TRIALS), dice, sides, chunk)
+             for i, ss in enumerate(children)]
+    counts = np.zeros(dice * sides + 1, dtype=np.int64)
+    if workers > 1 and n_tasks > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for part in pool.map(_count_task, tasks):
+                counts += part
+    else:
+        for task in tasks:
+            counts += _count_task(task)
+    return counts
+
+
+def monte_carlo_dice_np(n_trials=1000000, dice=2, sides=6, seed=None, workers=1):
+    """Те саме, що monte_carlo_dice ({сума: ймовірність}), але векторно й для k кубиків з s гранями."""
+    if n_trials < 1:
+        raise ValueError("для ймовірностей потрібно n_trials >= 1")
+    counts = dice_counts(n_trials, dice, sides, seed, workers)
+    return {s: counts[s] / n_trials for s in range(dice, dice * sides + 1)}
+
+
+def exact_counts(dice=2, sides=6):
+    """
+    Точна кількість комбінацій для кожної суми (індекс — сума): коефіцієнти
+    (x + x**2 + ... + x**sides) ** dice, згортки цілих (без похибки округлення).
+    """
+    face = np.ones(sides + 1, dtype=object)
+    face[0] = 0
+    counts = np.array([1], dtype=object)
+    for _ in range(dice):
+        counts = np.convolve(counts, face)
+    return counts
+
+
+EXACT_INT_LIMIT = 4096   # dice * sides, до якого рахуємо цілими згортками
+
+
+def exact_distribution(dice=2, sides=6, method="auto"):
+    """
+    Точний розподіл суми dice кубиків з sides гранями: масив ймовірностей,
+    індекс — сума (для сум < dice — нулі).
+    method="int" — цілі згортки exact_counts, ділення без проміжного округлення;
+    method="fft" — (p(x)) ** dice одним rfft: степінь спектра й один обернений
+    перехід, O(N log N) для N = dice * sides; похибка ~1e-16 абсолютна
+    (від'ємний шум обрізається до нуля). auto — int до EXACT_INT_LIMIT, далі fft.
+    """
+    if dice < 1 or sides < 1:
+        raise ValueError("потрібні dice >= 1, sides >= 1")
+    if method == "auto":
+        method = "int" if dice * sides <= EXACT_INT_LIMIT else "fft"
+    if method == "int":
+        total = sides ** dice
+        return np.array([int(c) / total for c in exact_counts(dice, sides)])
+    if method != "fft":
+        raise ValueError(f"Невідомий метод: {method}")
+    size = dice * sides + 1
+    face = np.zeros(size)
+    face[1:sides + 1] = 1.0 / sides
+    probs = np.fft.irfft(np.fft.rfft(face) ** dice, n=size)
+    probs[:dice] = 0.0
+    np.clip(probs, 0.0, None, out=probs)
+    return probs
+
+
+def _wilson_halfwidth(counts, n, z):
+    # інтервал Вілсона: ненульова ширина й для сум, що ще не випадали
+    p = counts / n
+    denom = 1 + z * z / n
+    return z * np.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+
+
+def monte_carlo_until(tolerance=0.001, dice=2, sides=6, confidence=0.95, seed=None,
+                      min_batch=1 << 16, max_trials=10**9, budget=None):
+    """
+    Кидає кубики партіями, доки напівширина довірчого інтервалу (Вілсона, рівень
+    confidence) кожної ймовірності не стане <= tolerance, або до max_trials.
+    Розмір наступної партії прогнозується з найгіршого p * (1 - p), тож зайвих
+    кидків небагато. Кожна партія — свій потік з SeedSequence(seed).spawn.
+    Повертає словник: probabilities ({сума: ймовірність}), trials, halfwidth
+    (найбільша напівширина), elapsed, converged; якщо задано budget (фіксована
+    кількість кидків для порівняння) — ще saved_trials, saved_seconds і overrun_trials.
+    saved_seconds не виміряно, а екстрапольовано з виміряної швидкості:
+    (budget - trials) * elapsed / trials. Якщо для точності знадобилося
+    більше кидків, ніж budget, економія дорівнює нулю, а перевищення
+    записується в overrun_trials.
+    """
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    parent = np.random.SeedSequence(seed)
+    counts = np.zeros(dice * sides + 1, dtype=np.int64)
+    n = 0
+    width = math.inf
+    t0 = time.perf_counter()
+    while n < max_trials:
+        if n:
+            p = counts[dice:] / n
+            worst = float((p * (1 - p)).max())
+            needed = math.ceil(z * z * max(worst, 1 / n) / tolerance ** 2)
+            batch = min(max(needed - n, min_batch), n, max_trials - n)
+        else:
+            batch = min(min_batch, max_trials)
+        counts += _count_task((parent.spawn(1)[0], batch, dice, sides, CHUNK))
+        n += batch
+        width = float(_wilson_halfwidth(counts[dice:], n, z).max())
+        if width <= tolerance:
+            break
+    elapsed = time.perf_counter() - t0
+    result = {
+        "probabilities": {s: counts[s] / n for s in range(dice, dice * sides + 1)},
+        "trials": n,
+        "halfwidth": width,
+        "elapsed": elapsed,
+        "converged": width <= tolerance,
     }
+    if budget is not None:
+        saved = max(budget - n, 0)
+        result["saved_trials"] = saved
+        result["saved_seconds"] = saved * elapsed / n
+        result["overrun_trials"] = max(n - budget, 0)
+    return result
+
+
+def chi_square(counts, dice=2, sides=6):
+    """
+    Перевірка лічильників проти точного розподілу: (статистика хі-квадрат,
+    ступені свободи, найбільше відхилення ймовірності в стандартних похибках).
+    За правильного генератора статистика ~ dof ± sqrt(2 * dof).
+    """
+    probs = exact_distribution(dice, sides)[dice:]
+    observed = counts[dice:dice * sides + 1].astype(float)
+    n = observed.sum()
+    expected = n * probs
+    mask = expected > 0
+    stat = float((((observed - expected) ** 2)[mask] / expected[mask]).sum())
+    sigma = np.sqrt(probs * (1 - probs) / n)
+    z = np.abs(observed / n - probs)[sigma > 0] / sigma[sigma > 0]
+    return stat, int(mask.sum()) - 1, float(z.max()) if len(z) else 0.0
+
+
+def benchmark(trials=(10**6, 10**7, 10**8), dice=2, sides=6, workers=None):
+    workers = workers or os.cpu_count() or 1
+    print(f"ядер: {os.cpu_count()}, workers = {workers}")
+    print(f"{'кидків':>11} | {'random.randint':>14} | {'NumPy':>8} | {'пул':>8} | {'хі²/dof':>12} | {'max |z|':>7}")
+    for n in trials:
+        if n <= 10**6 and (dice, sides) == (2, 6):
+            t0 = time.perf_counter()
+            monte_carlo_dice(n)
+            loop = f"{time.perf_counter() - t0:>13.2f}s"
+        else:
+            loop = "пропущено"
+        t0 = time.perf_counter()
+        counts = dice_counts(n, dice, sides, seed=1)
+        t_np = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        pooled = dice_counts(n, dice, sides, seed=1, workers=workers)
+        t_pool = time.perf_counter() - t0
+        assert np.array_equal(counts, pooled)   # той самий seed — ті самі лічильники
+        stat, dof, z = chi_square(counts, dice, sides)
+        print(f"{n:>11} | {loop:>14} | {t_np:>7.2f}s | {t_pool:>7.2f}s | {stat:>6.1f}/{dof:<5} | {z:>7.2f}")
+
+
+def benchmark_exact(cases=((2, 6), (10, 20), (100, 6), (100, 100), (1000, 100))):
+    """Цілі згортки проти FFT: час і найбільша розбіжність."""
+    print(f"{'кубиків':>7} | {'граней':>6} | {'int':>9} | {'fft':>9} | {'max |Δ|':>9}")
+    for dice, sides in cases:
+        if dice * sides <= 10 * EXACT_INT_LIMIT:
+            t0 = time.perf_counter()
+            ref = exact_distribution(dice, sides, "int")
+            t_int = f"{time.perf_counter() - t0:>8.4f}s"
+        else:
+            ref, t_int = None, "пропущено"
+        t0 = time.perf_counter()
+        fft = exact_distribution(dice, sides, "fft")
+        t_fft = time.perf_counter() - t0
+        diff = f"{np.abs(fft - ref).max():>9.1e}" if ref is not None else "—"
+        print(f"{dice:>7} | {sides:>6} | {t_int:>9} | {t_fft:>8.4f}s | {diff:>9}")
+
+
+def benchmark_early_stop(tolerances=(0.005, 0.002, 0.001, 0.0005), dice=2, sides=6, budget=10**7):
+    """Скільки кидків і часу потрібно до заданої точності проти фіксованого бюджету."""
+    exact = exact_distribution(dice, sides)
+    print(f"фіксований бюджет: {budget} кидків")
+    print(f"{'tolerance':>9} | {'кидків':>10} | {'час':>7} | {'напівширина':>11} | "
+          f"{'max |p̂-p|':>9} | {'зекономлено*':>12}")
+    for tol in tolerances:
+        r = monte_carlo_until(tol, dice, sides, seed=1, budget=budget)
+        err = max(abs(p - exact[s]) for s, p in r["probabilities"].items())
+        print(f"{tol:>9} | {r['trials']:>10} | {r['elapsed']:>6.2f}s | {r['halfwidth']:>11.5f} | "
+              f"{err:>9.5f} | {r['saved_seconds']:>11.2f}s")
+    print("* екстрапольовано з виміряної швидкості, не виміряно окремим запуском")
+
+
+def main(dice=2, sides=6, trials=200000, tolerance=None, seed=None, plot=True):
+    # Симуляція: фіксована кількість кидків або до заданої точності
+    if tolerance is None:
+        probs = monte_carlo_dice_np(trials, dice, sides, seed)
+    else:
+        r = monte_carlo_until(tolerance, dice, sides, seed=seed, budget=trials)
+        probs = r["probabilities"]
+        if r["overrun_trials"]:
+            budget_note = f"бюджет перевищено на {r['overrun_trials']} кидків"
+        else:
+            budget_note = f"зекономлено ~{r['saved_seconds']:.2f}s (оцінка за швидкістю)"
+        print(f"Кидків: {r['trials']} (бюджет {trials}), напівширина інтервалу {r['halfwidth']:.5f}, "
+              + budget_note + ("" if r["converged"] else " — точності не досягнуто"))
+
+    # Аналітичні результати
+    analytical = exact_distribution(dice, sides)
 
     # Таблиця
     df = pd.DataFrame({
         "Сума": list(probs.keys()),
         "Monte Carlo (%)": [round(probs[s]*100, 2) for s in probs],
-        "Аналітична (%)": [round(analytical[s]*100, 2) for s in analytical]
+        "Аналітична (%)": [round(analytical[s]*100, 2) for s in probs]
     })
 
     print(df)
+    if not plot:
+        return
 
     # Графік
     plt.bar(df["Сума"], df["Monte Carlo (%)"], alpha=0.6, label="Monte Carlo")
     plt.plot(df["Сума"], df["Аналітична (%)"], color="red", marker="o", label="Аналітична")
     plt.xlabel("Сума на кубиках")
     plt.ylabel("Ймовірність (%)")
-    plt.title("Ймовірність сум при киданні двох кубиків (Метод Монте-Карло)")
+    plt.title(f"Ймовірність сум при киданні {dice} кубиків d{sides} (Метод Монте-Карло)")
     plt.legend()
     plt.show()
 
 if __name__ == "__main__":
-    main()
+    ap = argparse.ArgumentParser(description="Метод Монте-Карло для сум на кубиках.")
+    ap.add_argument("--bench", choices=["mc", "exact", "stop"],
+                    help="mc — random.randint, NumPy і пул процесів з перевіркою хі-квадрат; "
+                         "exact — цілі згортки проти FFT; stop — зупинка за точністю")
+    ap.add_argument("--dice", type=int, default=2, help="Кількість кубиків")
+    ap.add_argument("--sides", type=int, default=6, help="Кількість граней")
+    ap.add_argument("--trials", type=int, default=200000,
+                    help="Кількість кидків (з --tolerance — бюджет для порівняння)")
+    ap.add_argument("--tolerance", type=float,
+                    help="Зупинитися, щойно 95%% інтервал кожної ймовірності вужчий за ±tolerance")
+    ap.add_argument("--seed", type=int, help="Зерно генератора")
+    ap.add_argument("--no-plot", action="store_true", help="Лише таблиця, без графіка")
+    ap.add_argument("--workers", type=int, help="Процесів у пулі (за замовчуванням — кількість ядер)")
+    args = ap.parse_args()
+    if args.bench == "mc":
+        benchmark(dice=args.dice, sides=args.sides, workers=args.workers)
+    elif args.bench == "exact":
+        benchmark_exact()
+    elif args.bench == "stop":
+        benchmark_early_stop(dice=args.dice, sides=args.sides)
+    else:
+        main(args.dice, args.sides, args.trials, args.tolerance, args.seed, plot=not args.no_plot)
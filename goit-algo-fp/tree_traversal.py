@@ -0,0 +1,192 @@
+"""
+Ітеративні обходи бінарних дерев без рекурсії.
+
+Працюють з будь-яким класом вузла проєкту: назви атрибутів дітей
+передаються параметрами left/right (за замовчуванням "left" і "right"),
+тож підходять і Node із завдань 4–5 (val), і Node з goit-algo-hw-08 (key).
+Кожен обхід — генератор вузлів, тому глибина дерева обмежена лише пам'яттю:
+вироджене дерево з мільйона вузлів не викликає RecursionError.
+
+    from tree_traversal import inorder
+    total = sum(node.key for node in inorder(root))
+"""
+
+import argparse
+import time
+from collections import deque
+from operator import attrgetter
+
+
+def preorder(root, left="left", right="right"):
+    """Корінь, ліве піддерево, праве піддерево. Стек — O(h)."""
+    get_l, get_r = attrgetter(left), attrgetter(right)
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        yield node
+        r = get_r(node)
+        if r is not None:
+            stack.append(r)
+        l = get_l(node)
+        if l is not None:
+            stack.append(l)
+
+
+def inorder(root, left="left", right="right"):
+    """Ліве піддерево, корінь, праве піддерево (для BST — за зростанням ключів)."""
+    get_l, get_r = attrgetter(left), attrgetter(right)
+    stack = []
+    node = root
+    while stack or node is not None:
+        while node is not None:
+            stack.append(node)
+            node = get_l(node)
+        node = stack.pop()
+        yield node
+        node = get_r(node)
+
+
+def postorder(root, left="left", right="right"):
+    """Ліве піддерево, праве піддерево, корінь. Один стек з позначкою "діти вже оброблено"."""
+    get_l, get_r = attrgetter(left), attrgetter(right)
+    stack = [(root, False)] if root is not None else []
+    while stack:
+        node, expanded = stack.pop()
+        if expanded:
+            yield node
+            continue
+        stack.append((node, True))
+        r = get_r(node)
+        if r is not None:
+            stack.append((r, False))
+        l = get_l(node)
+        if l is not None:
+            stack.append((l, False))
+
+
+def level_order(root, left="left", right="right"):
+    """Обхід у ширину (рівень за рівнем), черга — O(ширина)."""
+    get_l, get_r = attrgetter(left), attrgetter(right)
+    queue = deque([root] if root is not None else [])
+    while queue:
+        node = queue.popleft()
+        yield node
+        l = get_l(node)
+        if l is not None:
+            queue.append(l)
+        r = get_r(node)
+        if r is not None:
+            queue.append(r)
+
+
+def _morris(root, left, right, pre):
+    get_l, get_r = attrgetter(left), attrgetter(right)
+    cur = root
+    while cur is not None:
+        l = get_l(cur)
+        if l is None:
+            yield cur
+            cur = get_r(cur)
+            continue
+        # найправіший вузол лівого піддерева — попередник cur
+        prev = l
+        r = get_r(prev)
+        while r is not None and r is not cur:
+            prev = r
+            r = get_r(prev)
+        if r is None:
+            setattr(prev, right, cur)  # тимчасова "нитка" назад до cur
+            if pre:
+                yield cur
+            cur = l
+        else:
+            setattr(prev, right, None)  # прибираємо нитку
+            if not pre:
+                yield cur
+            cur = get_r(cur)
+
+
+def _restoring(gen):
+    # якщо споживач зупинився раніше, доходимо до кінця без видачі, щоб зняти всі нитки;
+    # не yield from: він закрив би й внутрішній генератор
+    try:
+        for node in gen:
+            yield node
+    finally:
+        for _ in gen:
+            pass
+
+
+def morris_inorder(root, left="left", right="right"):
+    """
+    Симетричний обхід Морріса: O(1) додаткової пам'яті. Під час обходу дерево
+    тимчасово змінюється (праві посилання-нитки), після завершення або
+    зупинки генератора воно відновлюється. Не змінюйте дерево під час обходу.
+    """
+    return _restoring(_morris(root, left, right, pre=False))
+
+
+def morris_preorder(root, left="left", right="right"):
+    """Прямий обхід Морріса: O(1) додаткової пам'яті, ті самі застереження."""
+    return _restoring(_morris(root, left, right, pre=True))
+
+
+# ---------- Бенчмарк ----------
+
+class _Node:
+    __slots__ = ("key", "left", "right")
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+
+
+def skewed_tree(n):
+    """Вироджене дерево (як BST із відсортованого входу): ланцюжок правих дітей."""
+    root = cur = _Node(0)
+    for k in range(1, n):
+        cur.right = _Node(k)
+        cur = cur.right
+    return root
+
+
+def balanced_tree(n):
+    """Ідеально збалансоване BST з ключів 0..n-1 (ітеративно, через стек відрізків)."""
+    if n == 0:
+        return None
+    nodes = [_Node(k) for k in range(n)]
+    stack = [(0, n - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        mid = (lo + hi) // 2
+        if lo <= mid - 1:
+            nodes[mid].left = nodes[(lo + mid - 1) // 2]
+            stack.append((lo, mid - 1))
+        if mid + 1 <= hi:
+            nodes[mid].right = nodes[(mid + 1 + hi) // 2]
+            stack.append((mid + 1, hi))
+    return nodes[(n - 1) // 2]
+
+
+def benchmark(n=1_000_000):
+    traversals = [("preorder", preorder), ("inorder", inorder), ("postorder", postorder),
+                  ("level_order", level_order), ("morris_inorder", morris_inorder),
+                  ("morris_preorder", morris_preorder)]
+    print(f"n = {n}")
+    print(f"{'обхід':<16} | {'вироджене':>10} | {'збалансоване':>12}")
+    trees = {"skewed": skewed_tree(n), "balanced": balanced_tree(n)}
+    for name, fn in traversals:
+        times = []
+        for tree in trees.values():
+            t0 = time.perf_counter()
+            total = sum(node.key for node in fn(tree))
+            times.append(time.perf_counter() - t0)
+            assert total == n * (n - 1) // 2
+        print(f"{name:<16} | {times[0]:>9.3f}s | {times[1]:>11.3f}s")
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Бенчмарк ітеративних обходів дерева.")
+    ap.add_argument("-n", type=int, default=1_000_000, help="Кількість вузлів")
+    benchmark(ap.parse_args().n)
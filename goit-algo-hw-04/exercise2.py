@@ -1,46 +1,172 @@
 import argparse
-import turtle
+import math
+import sys
+from array import array
+from itertools import islice
+from typing import Iterator, Tuple
+
+try:
+    import numpy as np
+except Exception:
+    np = None
+
+# 6 можливих напрямків (кратні 60°), щоб не накопичувати похибку кута
+_DIRS = [(math.cos(math.radians(60 * k)), math.sin(math.radians(60 * k))) for k in range(6)]
+
+
+def _koch_turns(order: int) -> Iterator[int]:
+    """
+    Повороти (в одиницях 60°) між сусідніми відрізками кривої Коха порядку order.
+    Поворот після i-го відрізка визначає молодша не-3 цифра i у четвірковій системі:
+    0 -> +1 (ліворуч 60°), 1 -> -2 (праворуч 120°), 2 -> +1. Пам'ять — O(1).
+    """
+    for i in range(4 ** order - 1):
+        while i % 4 == 3:
+            i //= 4
+        yield -2 if i % 4 == 1 else 1
+
+
+def koch_points(order: int, size: float = 300) -> Iterator[Tuple[float, float]]:
+    """
+    Потоково видає вершини сніжинки Коха (замкнена ламана, перша точка повторюється
+    в кінці) без рекурсії й без turtle. Стартова точка й напрямки — як у draw_snowflake.
+    """
+    step = size / 3 ** order
+    x, y = -size / 2, size / 3
+    heading = 0
+    yield x, y
+    for _ in range(3):
+        for turn in _koch_turns(order):
+            dx, dy = _DIRS[heading]
+            x += step * dx
+            y += step * dy
+            yield x, y
+            heading = (heading + turn) % 6
+        dx, dy = _DIRS[heading]
+        x += step * dx
+        y += step * dy
+        yield x, y
+        heading = (heading - 2) % 6  # right(120) між сторонами
+
+
+def koch_points_numpy(order: int, size: float = 300):
+    """
+    Векторна версія: кожен рівень ділить усі відрізки одночасно (NumPy).
+    Повертає масив (3 * 4**order + 1, 2) — швидко, але тримає всю ламану в пам'яті.
+    """
+    if np is None:
+        raise RuntimeError("для koch_points_numpy потрібен numpy")
+    h = size * math.sqrt(3) / 2
+    x0, y0 = -size / 2, size / 3
+    pts = np.array([[x0, y0], [x0 + size, y0], [x0 + size / 2, y0 - h], [x0, y0]])
+    c, s = math.cos(math.pi / 3), math.sin(math.pi / 3)
+    for _ in range(order):
+        a, b = pts[:-1], pts[1:]
+        d = (b - a) / 3
+        p1 = a + d
+        p3 = a + 2 * d
+        p2 = p1 + np.column_stack((d[:, 0] * c - d[:, 1] * s, d[:, 0] * s + d[:, 1] * c))
+        out = np.empty((4 * len(a) + 1, 2))
+        out[0:-1:4], out[1::4], out[2::4], out[3::4] = a, p1, p2, p3
+        out[-1] = pts[-1]
+        pts = out
+    return pts
+
+
+def _chunks(points, n: int = 65536):
+    it = iter(points)
+    while True:
+        block = list(islice(it, n))
+        if not block:
+            return
+        yield block
+
+
+def write_svg(points, path: str, size: float) -> None:
+    """Пише ламану в SVG блоками — у пам'яті лише поточний блок точок."""
+    pad = size * 0.1
+    # межі фігури: x у [-size/2, size/2], y у [y0 - h, y0 + h/3] (верхній зубець);
+    # у SVG вісь y дивиться вниз, тому точки пишемо з -y і рамку теж віддзеркалюємо
+    h = size * math.sqrt(3) / 2
+    y0 = size / 3
+    top, height = -(y0 + h / 3), h + h / 3
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<svg xmlns="http://www.w3.org/2000/svg" '
+                f'viewBox="{-size / 2 - pad:.1f} {top - pad:.1f} {size + 2 * pad:.1f} {height + 2 * pad:.1f}">\n'
+                '<polyline fill="none" stroke="royalblue" stroke-width="1" points="')
+        for block in _chunks(points):
+            f.write(" ".join(f"{x:.3f},{-y:.3f}" for x, y in block))
+            f.write(" ")
+        f.write('"/>\n</svg>\n')
+
+
+def write_csv(points, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("x,y\n")
+        for block in _chunks(points):
+            f.write("".join(f"{x:.6f},{y:.6f}\n" for x, y in block))
+
+
+def write_binary(points, path: str) -> None:
+    """Сирі float64 пари (x, y) у порядку байтів платформи."""
+    with open(path, "wb") as f:
+        for block in _chunks(points):
+            array("d", (c for xy in block for c in xy)).tofile(f)
 
-def koch_segment(t: turtle.Turtle, order: int, size: float) -> None:
-    if order == 0:
-        t.forward(size)
-    else:
-        size /= 3.0
-        koch_segment(t, order - 1, size)
-        t.left(60)
-        koch_segment(t, order - 1, size)
-        t.right(120)
-        koch_segment(t, order - 1, size)
-        t.left(60)
-        koch_segment(t, order - 1, size)
 
 def draw_snowflake(order: int, size: float = 300) -> None:
+    import turtle
+
     screen = turtle.Screen()
     screen.title(f"Сніжинка Коха (order={order})")
     screen.bgcolor("white")
+    screen.tracer(0, 0)
 
     t = turtle.Turtle(visible=False)
     t.speed(0)
     t.penup()
-    t.goto(-size/2, size/3)
-    t.pendown()
 
     t.color("royalblue")
     t.pensize(2)
 
-    for _ in range(3):
-        koch_segment(t, order, size)
-        t.right(120)
+    points = koch_points(order, size)
+    t.goto(*next(points))
+    t.pendown()
+    for x, y in points:
+        t.goto(x, y)
 
     t.hideturtle()
+    screen.update()
     turtle.done()
 
 def main():
     ap = argparse.ArgumentParser(description="Візуалізація 'сніжинки Коха'.")
     ap.add_argument("--level", "-l", type=int, default=3, help="Рівень рекурсії (0..7 рекомендовано)")
     ap.add_argument("--size", "-s", type=float, default=300, help="Базовий розмір фігури")
+    ap.add_argument("--svg", help="Записати ламану в SVG (без вікна turtle)")
+    ap.add_argument("--csv", help="Записати вершини в CSV (без вікна turtle)")
+    ap.add_argument("--bin", help="Записати вершини як float64 (x, y) (без вікна turtle)")
+    ap.add_argument("--engine", choices=["stream", "numpy"], default="stream",
+                    help="stream — потоково з обмеженою пам'яттю; numpy — векторно, уся ламана в пам'яті")
     args = ap.parse_args()
-    draw_snowflake(args.level, args.size)
+
+    outputs = [(args.svg, lambda p: write_svg(p, args.svg, args.size)),
+               (args.csv, lambda p: write_csv(p, args.csv)),
+               (args.bin, lambda p: write_binary(p, args.bin))]
+    outputs = [(path, write) for path, write in outputs if path]
+    if not outputs:
+        draw_snowflake(args.level, args.size)
+        return
+
+    if args.engine == "numpy":
+        pts = koch_points_numpy(args.level, args.size)
+        for _, write in outputs:
+            write(map(tuple, pts))
+    else:
+        for _, write in outputs:
+            write(koch_points(args.level, args.size))
+    n = 3 * 4 ** args.level + 1
+    print(f"Записано {n} вершин: {', '.join(path for path, _ in outputs)}", file=sys.stderr)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,537 @@
+"""
+Самобалансоване AVL-дерево без рекурсії.
+
+- вставка й видалення за O(log n) (шлях від кореня зберігається у стеку);
+- побудова з відсортованих ключів за O(n) (from_sorted);
+- кожен вузол знає розмір піддерева, тож k-та найменша (kth_smallest)
+  і ранг ключа (rank) — теж O(log n).
+Як і insert_bst, дублікати ігноруються. Вузли мають поля key/left/right,
+тож min_value і sum_tree з exercise1/exercise2 працюють і з цим деревом.
+Виняток — AggregateTree з lazy=True: ліниво видалені вузли лишаються в
+дереві до rebuild(), тож до перебудови беріть його власні total() і min_value().
+
+AggregateTree додатково тримає у вузлах суму, мінімум і максимум піддерева:
+range_sum(lo, hi) — O(log n), сума всього дерева — O(1), видалення може
+бути лінивим (вузол лише позначається мертвим до перебудови).
+"""
+
+import argparse
+import random
+import sys
+import time
+
+
+class AVLNode:
+    __slots__ = ("key", "left", "right", "height", "size")
+    alive = True  # для лінивого видалення в AggregateTree
+
+    def __init__(self, key):
+        self.key = key
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1
+
+    def pull(self):
+        """Перераховує висоту й розмір (кількість живих ключів) з дітей."""
+        lh, rh = _h(self.left), _h(self.right)
+        self.height = (lh if lh > rh else rh) + 1
+        self.size = _s(self.left) + _s(self.right) + 1
+
+
+class AggregateNode(AVLNode):
+    __slots__ = ("alive", "sum", "min", "max")
+
+    def __init__(self, key):
+        super().__init__(key)
+        self.alive = True
+        self.sum = key
+        self.min = key
+        self.max = key
+
+    def pull(self):
+        left, right = self.left, self.right
+        lh, rh = _h(left), _h(right)
+        self.height = (lh if lh > rh else rh) + 1
+        if self.alive:
+            size, total, lo, hi = 1, self.key, self.key, self.key
+        else:
+            size, total, lo, hi = 0, 0, None, None
+        if left is not None and left.size:
+            size += left.size
+            total += left.sum
+            lo = left.min
+            if hi is None:
+                hi = left.max
+        if right is not None and right.size:
+            size += right.size
+            total += right.sum
+            hi = right.max
+            if lo is None:
+                lo = right.min
+        self.size, self.sum, self.min, self.max = size, total, lo, hi
+
+
+def _h(node):
+    return node.height if node is not None else 0
+
+
+def _s(node):
+    return node.size if node is not None else 0
+
+
+def _rotate_right(node):
+    top = node.left
+    node.left = top.right
+    top.right = node
+    node.pull()
+    top.pull()
+    return top
+
+
+def _rotate_left(node):
+    top = node.right
+    node.right = top.left
+    top.left = node
+    node.pull()
+    top.pull()
+    return top
+
+
+def _balance(node):
+    """Оновлює поля вузла й за потреби обертає; повертає новий корінь піддерева."""
+    node.pull()
+    diff = _h(node.left) - _h(node.right)
+    if diff > 1:
+        if _h(node.left.left) < _h(node.left.right):
+            node.left = _rotate_left(node.left)
+        return _rotate_right(node)
+    if diff < -1:
+        if _h(node.right.right) < _h(node.right.left):
+            node.right = _rotate_right(node.right)
+        return _rotate_left(node)
+    return node
+
+
+class AVLTree:
+    node_class = AVLNode
+    dead = 0  # ліниво видалені вузли (буває лише в AggregateTree)
+
+    def __init__(self, values=None):
+        self.root = None
+        if values is not None:
+            for v in values:
+                self.insert(v)
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """
+        Будує ідеально збалансоване дерево з відсортованих ключів за O(n).
+        Дублікати пропускаються. Без рекурсії: стек відрізків, потім висоти й
+        розміри рахуються у зворотному порядку створення (діти раніше за батьків).
+        """
+        unique = []
+        for k in keys:
+            if unique and not unique[-1] < k:
+                if k == unique[-1]:
+                    continue
+                raise ValueError("from_sorted очікує відсортовані ключі")
+            unique.append(k)
+        tree = cls()
+        if not unique:
+            return tree
+        created = []
+        mid = (len(unique) - 1) // 2
+        make = cls.node_class
+        tree.root = make(unique[mid])
+        created.append(tree.root)
+        stack = [(tree.root, 0, mid - 1, "left"), (tree.root, mid + 1, len(unique) - 1, "right")]
+        while stack:
+            parent, lo, hi, side = stack.pop()
+            if lo > hi:
+                continue
+            mid = (lo + hi) // 2
+            node = make(unique[mid])
+            setattr(parent, side, node)
+            created.append(node)
+            stack.append((node, lo, mid - 1, "left"))
+            stack.append((node, mid + 1, hi, "right"))
+        for node in reversed(created):
+            node.pull()
+        return tree
+
+    def __len__(self):
+        return _s(self.root)
+
+    def __contains__(self, key):
+        cur = self.root
+        while cur is not None:
+            if key < cur.key:
+                cur = cur.left
+            elif cur.key < key:
+                cur = cur.right
+            else:
+                return cur.alive
+        return False
+
+    def __iter__(self):
+        stack, cur = [], self.root
+        while stack or cur is not None:
+            while cur is not None:
+                stack.append(cur)
+                cur = cur.left
+            cur = stack.pop()
+            if cur.alive:
+                yield cur.key
+            cur = cur.right
+
+    def height(self):
+        return _h(self.root)
+
+    def _fix_path(self, path):
+        """Піднімається шляхом від листа до кореня, балансуючи кожен вузол."""
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            new = _balance(node)
+            if new is node:
+                continue
+            if i == 0:
+                self.root = new
+            elif path[i - 1].left is node:
+                path[i - 1].left = new
+            else:
+                path[i - 1].right = new
+
+    def insert(self, key):
+        """Вставляє ключ; повертає False, якщо він уже є."""
+        if self.root is None:
+            self.root = self.node_class(key)
+            return True
+        path = []
+        cur = self.root
+        while cur is not None:
+            path.append(cur)
+            if key < cur.key:
+                cur = cur.left
+            elif cur.key < key:
+                cur = cur.right
+            else:
+                if cur.alive:
+                    return False
+                cur.alive = True  # ключ був видалений ліниво — оживляємо
+                self.dead -= 1
+                self._fix_path(path)
+                return True
+        parent = path[-1]
+        if key < parent.key:
+            parent.left = self.node_class(key)
+        else:
+            parent.right = self.node_class(key)
+        self._fix_path(path)
+        return True
+
+    def delete(self, key):
+        """Видаляє ключ; повертає False, якщо його не було."""
+        path = []
+        cur = self.root
+        while cur is not None and cur.key != key:
+            path.append(cur)
+            cur = cur.left if key < cur.key else cur.right
+        if cur is None or not cur.alive:
+            return False
+        if cur.left is not None and cur.right is not None:
+            # ключ наступника переносимо сюди, видаляємо вузол наступника
+            path.append(cur)
+            succ = cur.right
+            while succ.left is not None:
+                path.append(succ)
+                succ = succ.left
+            cur.key = succ.key
+            if not succ.alive:
+                cur.alive = False
+            cur = succ
+        child = cur.left if cur.left is not None else cur.right
+        if not path:
+            self.root = child
+        elif path[-1].left is cur:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        self._fix_path(path)
+        return True
+
+    def min_value(self):
+        """Найменший ключ за O(log n) (висота AVL-дерева логарифмічна)."""
+        cur = self.root
+        if cur is None:
+            return None
+        while cur.left is not None:
+            cur = cur.left
+        return cur.key
+
+    def max_value(self):
+        cur = self.root
+        if cur is None:
+            return None
+        while cur.right is not None:
+            cur = cur.right
+        return cur.key
+
+    def kth_smallest(self, k):
+        """k-й найменший ключ (k від 1 до len) за розмірами піддерев."""
+        if not 1 <= k <= len(self):
+            raise IndexError("k поза межами дерева")
+        cur = self.root
+        while True:
+            left = _s(cur.left)
+            if k <= left:
+                cur = cur.left
+            elif cur.alive and k == left + 1:
+                return cur.key
+            else:
+                k -= left + cur.alive
+                cur = cur.right
+
+    def rank(self, key):
+        """Кількість ключів, строго менших за key."""
+        r = 0
+        cur = self.root
+        while cur is not None:
+            if key <= cur.key:
+                cur = cur.left
+            else:
+                r += _s(cur.left) + cur.alive
+                cur = cur.right
+        return r
+
+
+class AggregateTree(AVLTree):
+    """
+    AVL-дерево, де кожен вузол тримає size/sum/min/max свого піддерева
+    (лише живих ключів). З lazy=True delete лише позначає вузол мертвим
+    (O(log n) без обертань); коли мертвих більше, ніж живих, дерево
+    перебудовується через from_sorted.
+    """
+
+    node_class = AggregateNode
+
+    def __init__(self, values=None, lazy=False):
+        self.lazy = lazy
+        super().__init__(values)
+
+    def delete(self, key):
+        if not self.lazy:
+            return super().delete(key)
+        path = []
+        cur = self.root
+        while cur is not None and cur.key != key:
+            path.append(cur)
+            cur = cur.left if key < cur.key else cur.right
+        if cur is None or not cur.alive:
+            return False
+        cur.alive = False
+        path.append(cur)
+        for node in reversed(path):
+            node.pull()
+        self.dead += 1
+        if self.dead > len(self):
+            self.rebuild()
+        return True
+
+    def rebuild(self):
+        """Фізично прибирає ліниво видалені вузли за O(n)."""
+        self.root = type(self).from_sorted(list(self)).root
+        self.dead = 0
+
+    def total(self):
+        """Сума всіх ключів за O(1)."""
+        return self.root.sum if self.root is not None else 0
+
+    def min_value(self):
+        return self.root.min if self.root is not None else None
+
+    def max_value(self):
+        return self.root.max if self.root is not None else None
+
+    def _prefix(self, key, inclusive):
+        """(кількість, сума) ключів < key (або <= key) за один спуск."""
+        count = total = 0
+        cur = self.root
+        while cur is not None:
+            if cur.key < key or (inclusive and cur.key == key):
+                left = cur.left
+                if left is not None:
+                    count += left.size
+                    total += left.sum
+                if cur.alive:
+                    count += 1
+                    total += cur.key
+                cur = cur.right
+            else:
+                cur = cur.left
+        return count, total
+
+    def range_sum(self, lo, hi):
+        """Сума ключів з [lo, hi] за O(log n)."""
+        if hi < lo:
+            return 0
+        return self._prefix(hi, True)[1] - self._prefix(lo, False)[1]
+
+    def range_count(self, lo, hi):
+        if hi < lo:
+            return 0
+        return self._prefix(hi, True)[0] - self._prefix(lo, False)[0]
+
+    def range_aggregate(self, lo, hi):
+        """
+        (count, sum, min, max) ключів з [lo, hi] за O(log n): відрізок
+        розкладається на вузол розгалуження та повні піддерева вздовж
+        двох меж. Для порожнього відрізка min і max — None.
+        """
+        cur = self.root
+        while cur is not None and not (lo <= cur.key <= hi):
+            cur = cur.left if hi < cur.key else cur.right
+        if cur is None:
+            return 0, 0, None, None
+        # частини відрізка за зростанням ключів: вузол (свій ключ) або повне піддерево
+        left_parts = []
+        node = cur.left
+        while node is not None:
+            if lo <= node.key:
+                left_parts.append((node, node.right))
+                node = node.left
+            else:
+                node = node.right
+        pieces = []
+        for node, sub in reversed(left_parts):
+            pieces.append((node, False))
+            pieces.append((sub, True))
+        pieces.append((cur, False))
+        node = cur.right
+        while node is not None:
+            if node.key <= hi:
+                pieces.append((node.left, True))
+                pieces.append((node, False))
+                node = node.right
+            else:
+                node = node.left
+
+        count = total = 0
+        lo_key = hi_key = None
+        for node, whole in pieces:
+            if node is None:
+                continue
+            if whole:
+                if not node.size:
+                    continue
+                count += node.size
+                total += node.sum
+                first, last = node.min, node.max
+            else:
+                if not node.alive:
+                    continue
+                count += 1
+                total += node.key
+                first = last = node.key
+            if lo_key is None:
+                lo_key = first
+            hi_key = last
+        return count, total, lo_key, hi_key
+
+
+def build_avl(values):
+    """Аналог build_bst: відсортований вхід іде через from_sorted за O(n)."""
+    values = list(values)
+    if all(a <= b for a, b in zip(values, values[1:])):
+        return AVLTree.from_sorted(values)
+    return AVLTree(values)
+
+
+def benchmark(sizes=(1_000, 5_000, 100_000)):
+    from exercise1 import build_bst
+
+    print(f"{'n':>7} | {'вхід':<10} | {'build_bst':>12} | {'AVLTree':>9} | {'build_avl':>9} | висота")
+    for n in sizes:
+        for kind in ("sorted", "random"):
+            data = list(range(n)) if kind == "sorted" else random.Random(1).sample(range(n * 10), n)
+            if kind == "sorted" and n > 5_000:
+                # глибина рекурсії = n: O(n²) і ризик переповнити стек C — не запускаємо
+                bst = "пропущено"
+            else:
+                old_limit = sys.getrecursionlimit()
+                sys.setrecursionlimit(max(old_limit, 3 * n))
+                try:
+                    t0 = time.perf_counter()
+                    build_bst(data)
+                    bst = f"{time.perf_counter() - t0:>11.3f}s"
+                except RecursionError:
+                    bst = "RecursionError"
+                finally:
+                    sys.setrecursionlimit(old_limit)
+            t0 = time.perf_counter()
+            AVLTree(data)
+            avl = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            tree = build_avl(data)
+            bulk = time.perf_counter() - t0
+            print(f"{n:>7} | {kind:<10} | {bst:>12} | {avl:>8.3f}s | {bulk:>8.3f}s | {tree.height()}")
+
+
+def benchmark_aggregate(n=1_000_000, queries=100_000):
+    """Запити range_sum/s на n ключах проти повного обходу sum_tree."""
+    from exercise2 import sum_tree
+
+    rng = random.Random(1)
+    keys = sorted(rng.sample(range(n * 10), n))
+    t0 = time.perf_counter()
+    tree = AggregateTree.from_sorted(keys)
+    print(f"n = {n}, from_sorted: {time.perf_counter() - t0:.2f}s")
+
+    t0 = time.perf_counter()
+    full = sum_tree(tree.root)
+    walk = time.perf_counter() - t0
+    assert full == tree.total() == sum(keys)
+    print(f"sum_tree (повний обхід): {walk * 1000:.1f} мс/запит, {1 / walk:,.1f} запитів/с")
+
+    bounds = [tuple(sorted((rng.randrange(n * 10), rng.randrange(n * 10)))) for _ in range(queries)]
+    t0 = time.perf_counter()
+    for lo, hi in bounds:
+        tree.range_sum(lo, hi)
+    elapsed = time.perf_counter() - t0
+    print(f"range_sum:       {queries / elapsed:>12,.0f} запитів/с")
+    t0 = time.perf_counter()
+    for lo, hi in bounds:
+        tree.range_aggregate(lo, hi)
+    elapsed = time.perf_counter() - t0
+    print(f"range_aggregate: {queries / elapsed:>12,.0f} запитів/с")
+    t0 = time.perf_counter()
+    for _ in range(queries):
+        tree.total()
+    elapsed = time.perf_counter() - t0
+    print(f"total:           {queries / elapsed:>12,.0f} запитів/с")
+
+    victims = rng.sample(keys, min(queries, n // 4))
+    for lazy in (False, True):
+        t = AggregateTree.from_sorted(keys)
+        t.lazy = lazy
+        t0 = time.perf_counter()
+        for k in victims:
+            t.delete(k)
+        elapsed = time.perf_counter() - t0
+        print(f"delete (lazy={lazy!s:<5}): {len(victims) / elapsed:>10,.0f} видалень/с")
+        rest = set(keys).difference(victims)
+        assert t.total() == sum(rest) and t.min_value() == min(rest)
+        t.rebuild()
+        assert sum_tree(t.root) == t.total() == sum(rest)
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="AVL-дерево: бенчмарки.")
+    ap.add_argument("--bench", choices=["build", "aggregate"], default="build",
+                    help="build — побудова проти build_bst; aggregate — range_sum на n ключах")
+    ap.add_argument("-n", type=int, default=1_000_000, help="Кількість ключів для aggregate")
+    args = ap.parse_args()
+    if args.bench == "aggregate":
+        benchmark_aggregate(args.n)
+    else:
+        benchmark()
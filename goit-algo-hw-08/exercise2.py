@@ -22,9 +22,17 @@ def build_bst(values):
     return root
 
 def sum_tree(root):
-    if root is None:
-        return 0
-    return sum_tree(root.left) + root.key + sum_tree(root.right)
+    # ітеративно: вироджене дерево (з відсортованого входу) не впирається в ліміт рекурсії
+    total = 0
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        total += node.key
+        if node.left is not None:
+            stack.append(node.left)
+        if node.right is not None:
+            stack.append(node.right)
+    return total
 
 def parse_numbers(s):
     if not s.strip():